@@ -1,60 +1,277 @@
 """
 Nuitka Build Script for ConverterX
 
-Builds either a single executable file or standalone folder distribution.
+Builds a standalone folder distribution by default, or a single executable
+file with --mode onefile. Runs non-interactively so it can be used in CI.
+
+Compilation caches are kept in .nuitka-cache/ and .nuitka-ccache/ so repeat
+builds only recompile what changed; CI jobs should persist both folders.
+
+Usage:
+    python build.py [--mode {standalone,onefile}] [--clean] [--jobs N]
+                    [--release] [--pgo] [--ccache-dir PATH]
 """
 
+import argparse
+import compileall
+import hashlib
+import os
+from fnmatch import fnmatch
+from importlib import metadata
 import subprocess
 import sys
 import platform
+import threading
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def get_build_mode():
-    """Prompt user to choose build mode."""
-    print("=" * 60)
-    print("ConverterX Build Configuration")
-    print("=" * 60)
-    print("\nChoose build mode:")
-    print("  1. One-File  - Single executable (slower startup, easier to distribute)")
-    print("  2. Standalone - Folder with dependencies (faster startup, larger)")
-    print("=" * 60)
+# Persistent compilation caches (kept between builds for incremental speed)
+NUITKA_CACHE_DIR = Path(".nuitka-cache")
+CCACHE_DIR = Path(".nuitka-ccache")
+
+# Inputs that affect the build output, and folders never scanned for them
+SOURCE_PATTERNS = ("*.py", "*.qss", "*.ico", "requirements.txt")
+IGNORED_DIRS = {"dist", ".nuitka-cache", ".nuitka-ccache", ".git", "__pycache__", "venv", ".venv", "logs"}
+
+# Installed packages whose code ends up in the build (or produces it)
+BUNDLED_PACKAGES = ("PySide6", "Pillow", "pillow-heif", "pillow-avif-plugin", "psutil", "Nuitka")
+
+# Hash of the sources + Nuitka command that produced the current dist/
+BUILD_HASH_FILE = Path("dist") / ".build_hash"
+
+# Supported image extensions captured at build time (read by utils.file_utils)
+SUPPORTED_FORMATS_FILE = Path("supported_formats.json")
+
+# Registers the same Pillow plugins as main.py, then records what they can open
+SNAPSHOT_SCRIPT = (
+    "import json, sys; "
+    "from pillow_heif import register_heif_opener; register_heif_opener(); "
+    "import pillow_avif; "
+    "from utils.file_utils import _get_pillow_supported_extensions; "
+    "json.dump(_get_pillow_supported_extensions(), open(sys.argv[1], 'w'))"
+)
+
+
+def parse_args(argv=None):
+    """Parse build options from the command line."""
+    parser = argparse.ArgumentParser(description="Build ConverterX with Nuitka.")
+    parser.add_argument(
+        "--mode", choices=("standalone", "onefile"), default="standalone",
+        help="standalone folder (fast startup, default) or single self-extracting executable"
+    )
+    parser.add_argument(
+        "--clean", action="store_true",
+        help="delete dist/ before building (caches are kept)"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count() or 4,
+        help="parallel C compile jobs (default: CPU count)"
+    )
+    parser.add_argument(
+        "--release", action="store_true", default=bool(os.environ.get("RELEASE")),
+        help="optimized release build with LTO (also enabled by RELEASE=1)"
+    )
+    parser.add_argument(
+        "--pgo", action="store_true",
+        help="enable profile-guided optimization (release builds only, runs the app once)"
+    )
+    parser.add_argument(
+        "--ccache-dir", type=Path, default=CCACHE_DIR,
+        help=f"ccache folder (default: {CCACHE_DIR})"
+    )
+    return parser.parse_args(argv)
+
+
+def precompile_bytecode(dist_folder):
+    """
+    Precompile leftover .py files in the distribution to optimized .pyc.
+
+    Nuitka compiles imported modules to C, but plain .py files bundled as data
+    would otherwise be byte-compiled on first import on the user's machine.
+    Each source is replaced by a legacy-layout .pyc next to it.
+
+    Returns:
+        Number of modules precompiled
+    """
+    sources = list(Path(dist_folder).rglob("*.py"))
+    if not sources:
+        return 0
 
-    while True:
-        choice = input("\nEnter your choice (1 or 2): ").strip()
-        if choice == "1":
-            return "onefile"
-        elif choice == "2":
-            return "standalone"
-        else:
-            print("Invalid choice. Please enter 1 or 2.")
+    compileall.compile_dir(
+        str(dist_folder), optimize=2, legacy=True, quiet=1, workers=os.cpu_count() or 1
+    )
+
+    compiled = 0
+    for source in sources:
+        if source.with_suffix(".pyc").exists():
+            source.unlink()
+            compiled += 1
+    return compiled
+
+
+def _walk_stats(root):
+    """Get (total_bytes, file_count) for one folder tree with os.scandir."""
+    total, count = 0, 0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    count += 1
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total, count
+
+
+def folder_stats(root):
+    """
+    Get total size and file count of a folder.
+
+    Uses os.scandir so file sizes come from the directory listing where the
+    OS provides them (Windows), instead of one stat() call per file. Each
+    top-level subfolder is walked in its own thread, since the walk is
+    bound by filesystem latency rather than CPU.
+
+    Returns:
+        (total_bytes, file_count) tuple
+    """
+    total, count = 0, 0
+    subdirs = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            else:
+                count += 1
+                total += entry.stat(follow_symlinks=False).st_size
+
+    with ThreadPoolExecutor() as executor:
+        for sub_total, sub_count in executor.map(_walk_stats, subdirs):
+            total += sub_total
+            count += sub_count
+    return total, count
+
+
+def shrink_release_binaries(dist_folder, executable):
+    """
+    Strip the executable and UPX-compress bundled DLLs of a standalone build.
+
+    Fewer bytes to read from disk at startup. Each tool is skipped if it
+    isn't installed; DLLs are compressed in parallel since UPX is slow.
+
+    Returns:
+        Number of DLLs compressed
+    """
+    strip = shutil.which("strip")
+    if platform.system() != "Windows" and strip:
+        subprocess.run([strip, str(executable)], check=False)
+
+    upx = shutil.which("upx")
+    dlls = list(Path(dist_folder).glob("*.dll"))
+    if not upx or not dlls:
+        return 0
 
+    def compress(dll):
+        result = subprocess.run([upx, "--best", "--lzma", "-q", str(dll)], capture_output=True)
+        return result.returncode == 0
 
-def build(mode):
-    """Build ConverterX with Nuitka in specified mode."""
+    with ThreadPoolExecutor() as executor:
+        return sum(executor.map(compress, dlls))
 
-    print("\n" + "=" * 60)
-    print(f"Building ConverterX with Nuitka ({mode.upper()} mode)...")
-    print("=" * 60)
 
-    # Clean previous build
-    dist_dir = Path("dist")
-    if dist_dir.exists():
-        print("\nCleaning previous build...")
-        shutil.rmtree(dist_dir)
+def _source_files(excluded_dirs):
+    """
+    Find build inputs under the project folder.
 
+    Ignored folders are pruned during the walk instead of filtered afterwards,
+    so large cache trees are never descended into.
+
+    Args:
+        excluded_dirs: Resolved folder paths to skip in addition to IGNORED_DIRS
+    """
+    for root, dirs, files in os.walk("."):
+        dirs[:] = [
+            d for d in dirs
+            if d not in IGNORED_DIRS
+            and not d.startswith("dist.old.")  # Old builds still being deleted by --clean
+            and Path(root, d).resolve() not in excluded_dirs
+        ]
+        for name in files:
+            if any(fnmatch(name, pattern) for pattern in SOURCE_PATTERNS):
+                yield Path(root, name)
+
+
+def source_hash(cmd, ccache_dir=CCACHE_DIR):
+    """
+    Hash every build input together with the Nuitka command line.
+
+    Besides the project sources this covers requirements.txt and the installed
+    versions of BUNDLED_PACKAGES, so a dependency upgrade forces a rebuild
+    (and a fresh supported formats snapshot). If nothing changed, the existing
+    dist/ output is already up to date.
+
+    Args:
+        cmd: Full Nuitka command line
+        ccache_dir: ccache folder, skipped when it lives inside the project
+    """
+    h = hashlib.sha256()
+    h.update(" ".join(cmd).encode("utf-8"))
+
+    for package in BUNDLED_PACKAGES:
+        try:
+            version = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            version = "missing"
+        h.update(f"{package}=={version}\n".encode("utf-8"))
+
+    for path in sorted(_source_files({Path(ccache_dir).resolve()})):
+        h.update(str(path).encode("utf-8"))
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def snapshot_supported_formats():
+    """
+    Write the list of image extensions Pillow can open to SUPPORTED_FORMATS_FILE.
+
+    Runs in a separate interpreter so plugin registration matches a fresh
+    app start. The compiled app reads this file instead of importing every
+    Pillow plugin at startup.
+    """
+    subprocess.run(
+        [sys.executable, "-c", SNAPSHOT_SCRIPT, str(SUPPORTED_FORMATS_FILE)],
+        check=True
+    )
+
+
+def nuitka_args(mode, jobs, release, pgo=False):
+    """
+    Build the platform-independent Nuitka command line.
+
+    Args:
+        mode: "standalone" or "onefile"
+        jobs: Parallel C compile jobs
+        release: Enable release-only optimizations (LTO, python flags)
+        pgo: Enable profile-guided optimization (release only)
+
+    Returns:
+        Argument list starting with the Python interpreter
+    """
     # Common arguments for all platforms
-    common_args = [
+    args = [
         sys.executable, "-m", "nuitka",
         "--enable-plugin=pyside6",
 
         # Include resource files
         "--include-data-file=assets.py=assets.py",
+        f"--include-data-file={SUPPORTED_FORMATS_FILE}={SUPPORTED_FORMATS_FILE}",
 
-        # Include required packages
-        "--include-package=pillow_avif",
-        "--include-package=psutil",
+        # Include required modules (only the AVIF plugin, not the whole package)
+        "--include-module=pillow_avif.AvifImagePlugin",
+        "--include-module=pillow_avif._avif",
 
         # Follow these imports (ensure they're included)
         "--follow-import-to=PIL",
@@ -67,6 +284,8 @@ def build(mode):
         "--nofollow-import-to=pandas",
         "--nofollow-import-to=test",
         "--nofollow-import-to=tests",
+        "--noinclude-unittest-mode=nofollow",
+        "--noinclude-setuptools-mode=nofollow",
 
         # Output settings
         "--output-dir=dist",
@@ -74,17 +293,48 @@ def build(mode):
 
         # Optimization
         "--assume-yes-for-downloads",
+        f"--jobs={jobs}",
     ]
 
+    # Link-time optimization only for release (slow to link, not worth it in dev)
+    if release:
+        args += [
+            "--lto=yes",
+            "--python-flag=no_site",
+            "--python-flag=no_asserts",
+            "--python-flag=no_docstrings",
+        ]
+
+        # Profile-guided optimization needs a profiling run of the app (opt-in)
+        if pgo:
+            args.append("--pgo-c")
+
+    # Clang generally produces faster code than GCC for Nuitka output (MSVC on Windows).
+    # Nuitka errors out on --clang when clang is missing, so GCC-only machines keep GCC.
+    if platform.system() != "Windows":
+        if shutil.which("clang"):
+            args.append("--clang")
+        else:
+            print("\nNote: clang not found - compiling with the default C compiler")
+
     # Add mode-specific argument
     if mode == "onefile":
-        common_args.append("--onefile")
+        args.append("--onefile")
     else:  # standalone
-        common_args.append("--standalone")
+        args.append("--standalone")
+
+    return args
+
 
-    # Platform-specific arguments
+def platform_args():
+    """
+    Get platform-specific Nuitka arguments and executable names.
+
+    Returns:
+        (args, exe_name, final_name) tuple
+    """
     if platform.system() == "Windows":
-        platform_args = [
+        args = [
             "--windows-icon-from-ico=app_icon.ico",
             "--company-name=Avaxerrr",
             "--product-name=ConverterX",
@@ -93,29 +343,116 @@ def build(mode):
             "--file-description=Modern Image Format Converter",
             "--copyright=Copyright (c) 2025 Avaxerrr",
             "--windows-console-mode=disable",
+            "--include-module=psutil._pswindows",
+            "--include-module=psutil._psutil_windows",
         ]
         exe_name = "main.exe"
         final_name = "ConverterX.exe"
     elif platform.system() == "Darwin":  # macOS
-        platform_args = [
+        args = [
             "--macos-app-icon=app_icon.icns",
             "--macos-app-name=ConverterX",
             "--macos-app-version=1.0.0",
+            "--include-module=psutil._psosx",
+            "--include-module=psutil._psutil_osx",
         ]
         exe_name = "main.bin"
         final_name = "ConverterX"
     else:  # Linux
-        platform_args = [
+        args = [
             "--linux-icon=app_icon.png",
+            "--include-module=psutil._pslinux",
+            "--include-module=psutil._psutil_linux",
         ]
         exe_name = "main.bin"
         final_name = "ConverterX"
 
+    return args, exe_name, final_name
+
+
+def run_streaming(cmd, env, while_running=None):
+    """
+    Run a command, echoing its output line by line through sys.stdout.
+
+    Keeps the child's output in order with this script's own prints (even
+    when stdout is a pipe in CI), and lets the caller do other work while
+    the command runs.
+
+    Args:
+        cmd: Command to run
+        env: Environment for the child process
+        while_running: Optional callable run on this thread while the command runs
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero code
+    """
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1, text=True, env=env
+    )
+
+    def pump():
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+
+    reader = threading.Thread(target=pump, daemon=True)
+    reader.start()
+
+    if while_running is not None:
+        while_running()
+
+    returncode = proc.wait()
+    reader.join()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def build(args):
+    """Build ConverterX with Nuitka using the parsed command line options."""
+    mode = args.mode
+
+    print("\n" + "=" * 60)
+    print(f"Building ConverterX with Nuitka ({mode.upper()} mode)...")
+    print("=" * 60)
+
+    # Release builds trade compile time for a faster binary
+    release = args.release
+
+    # Parallel jobs for the C compilation stage
+    jobs = args.jobs
+
+    platform_specific, exe_name, final_name = platform_args()
+
     # Entry point
     entry_point = ["main.py"]
 
     # Build command
-    cmd = common_args + platform_args + entry_point
+    cmd = nuitka_args(mode, jobs, release, args.pgo) + platform_specific + entry_point
+
+    # Skip the whole build when nothing changed since the last successful one.
+    # Hashed before --clean moves dist/ away, so the walk never races the
+    # background delete.
+    build_hash = source_hash(cmd, args.ccache_dir)
+    if not args.clean:
+        try:
+            if BUILD_HASH_FILE.read_text() == build_hash:
+                print("\n✓ Up to date - sources and build flags unchanged since last build")
+                return 0
+        except OSError:
+            pass  # No previous build
+    BUILD_HASH_FILE.unlink(missing_ok=True)  # Invalid until this build succeeds
+
+    # Clean previous build only when asked - keeps incremental builds warm.
+    # The old folder is renamed away instantly and deleted in the background
+    # while Nuitka generates C code, instead of blocking on thousands of unlinks.
+    dist_dir = Path("dist")
+    cleanup_thread = None
+    if dist_dir.exists() and args.clean:
+        print("\nCleaning previous build...")
+        old_dist = dist_dir.with_name(f"dist.old.{os.getpid()}")
+        dist_dir.rename(old_dist)
+        cleanup_thread = threading.Thread(target=shutil.rmtree, args=(old_dist,), kwargs={"ignore_errors": True})
+        cleanup_thread.start()
 
     print("\nRunning Nuitka with the following command:")
     print(" ".join(cmd))
@@ -125,8 +462,19 @@ def build(mode):
     else:
         print("\nThis may take 3-5 minutes...\n")
 
+    # Point Nuitka and ccache at stable project-local cache folders
+    env = os.environ.copy()
+    env["NUITKA_CACHE_DIR"] = str(NUITKA_CACHE_DIR.absolute())
+    env["CCACHE_DIR"] = str(args.ccache_dir.absolute())
+    env["MAKEFLAGS"] = f"-j{jobs}"
+    env["CL"] = "/MP"  # MSVC: compile multiple sources per invocation in parallel
+
     try:
-        result = subprocess.run(cmd, check=True)
+        snapshot_supported_formats()
+        # Finish deleting the old dist/ while Nuitka compiles
+        run_streaming(cmd, env, while_running=cleanup_thread.join if cleanup_thread else None)
+        BUILD_HASH_FILE.write_text(build_hash)
+
         print("\n" + "=" * 60)
         print("✓ Build completed successfully!")
         print("=" * 60)
@@ -163,13 +511,18 @@ def build(mode):
                 print(f"\n✓ Renamed {exe_name} → {final_name}")
 
             if final_path.exists():
-                folder_size = sum(f.stat().st_size for f in (dist_dir / "main.dist").rglob('*') if f.is_file())
+                if release:
+                    compressed = shrink_release_binaries(dist_dir / "main.dist", final_path)
+                    print(f"\n✓ Release binaries shrunk ({compressed} DLLs compressed)")
+
+                precompiled = precompile_bytecode(dist_dir / "main.dist")
+                if precompiled:
+                    print(f"\n✓ Precompiled {precompiled} bundled modules")
+
+                folder_size, file_count = folder_stats(dist_dir / "main.dist")
                 print(f"\nDistribution folder: {(dist_dir / 'main.dist').absolute()}")
                 print(f"Executable: {final_path.absolute()}")
                 print(f"Total size: {folder_size / (1024*1024):.2f} MB")
-
-                # Count files
-                file_count = len(list((dist_dir / "main.dist").rglob('*')))
                 print(f"Total files: {file_count}")
 
                 print("\n" + "=" * 60)
@@ -198,5 +551,4 @@ def build(mode):
 
 
 if __name__ == "__main__":
-    mode = get_build_mode()
-    sys.exit(build(mode))
+    sys.exit(build(parse_args()))
@@ -1,23 +1,36 @@
 """
-MODIFY core/__init__.py
-Add these to the existing imports and __all__
+Core conversion package.
+
+Public names are loaded lazily on first attribute access (PEP 562) so that
+`import core` doesn't pull in Pillow plugins or PySide6 until they're used.
 """
 
-from .converter import ImageConverter
-from .format_settings import (
-    ConversionSettings,
-    ImageFormat,
-    OutputLocationMode,
-    FilenameTemplate
-)
-from .output_preview_generator import OutputPreviewGenerator
-from .app_settings import SettingsKeys, AppSettingsController
-
-__all__ = [
-    'ImageConverter',
-    'ConversionSettings',
-    'ImageFormat',
-    'OutputLocationMode',
-    'FilenameTemplate',
-    'OutputPreviewGenerator'
-]
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
+    'ImageConverter': '.converter',
+    'ConversionSettings': '.format_settings',
+    'ImageFormat': '.format_settings',
+    'OutputLocationMode': '.format_settings',
+    'FilenameTemplate': '.format_settings',
+    'OutputPreviewGenerator': '.output_preview_generator',
+    'SettingsKeys': '.app_settings',
+    'AppSettingsController': '.app_settings',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -11,11 +11,32 @@ Settings Categories:
 """
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Signal, QSettings, QThreadPool
-from typing import Optional, cast
+from PySide6.QtCore import QObject, Signal, QSettings, QThreadPool, QTimer
+from typing import Any, Optional
 from core.format_settings import ImageFormat, OutputLocationMode, FilenameTemplate
 from utils.logger import logger
 
+# Stored setting strings -> enum values (built once, not per getter call)
+_FORMAT_MAP: dict[str, ImageFormat] = {
+    "WEBP": ImageFormat.WEBP,
+    "AVIF": ImageFormat.AVIF,
+    "JPEG": ImageFormat.JPEG,
+    "PNG": ImageFormat.PNG
+}
+
+_LOCATION_MAP: dict[str, OutputLocationMode] = {
+    "custom": OutputLocationMode.CUSTOM_FOLDER,
+    "same": OutputLocationMode.SAME_AS_SOURCE,
+    "ask": OutputLocationMode.ASK_EVERY_TIME,
+}
+
+_TEMPLATE_MAP: dict[str, FilenameTemplate] = {
+    "CONVERTED": FilenameTemplate.CONVERTED,
+    "FORMAT": FilenameTemplate.FORMAT,
+    "QUALITY": FilenameTemplate.QUALITY,
+    "CUSTOM": FilenameTemplate.CUSTOM,
+}
+
 
 class SettingsKeys:
     """
@@ -52,6 +73,32 @@ class SettingsKeys:
     PERFORMANCE_SHOW_RAM = "performance/show_ram"
     PERFORMANCE_UPDATE_INTERVAL = "performance/update_interval"
 
+    # Internal bookkeeping
+    SETTINGS_MIGRATED = "app/settings_migrated"  # Native store already checked for old settings
+
+
+# (key, default, type) for every setting with a fixed default, used to
+# fill the read cache in one pass. Defaults must match the getters.
+_ALL_KEYS = (
+    (SettingsKeys.MAX_CONCURRENT_WORKERS, 4, int),
+    (SettingsKeys.PREVIEW_CACHE_SIZE, 10, int),
+    (SettingsKeys.HD_CACHE_SIZE, 2, int),
+    (SettingsKeys.PREVIEW_MAX_DIMENSION, 1500, int),
+    (SettingsKeys.OUTPUT_PREVIEW_DEBOUNCE, 250, int),
+    (SettingsKeys.OUTPUT_PREVIEW_CACHE_SIZE, 2, int),
+    (SettingsKeys.DEFAULT_QUALITY, 85, int),
+    (SettingsKeys.DEFAULT_OUTPUT_FORMAT, "WEBP", str),
+    (SettingsKeys.DEFAULT_OUTPUT_LOCATION_MODE, "custom", None),
+    (SettingsKeys.DEFAULT_ENABLE_FILENAME_SUFFIX, True, bool),
+    (SettingsKeys.DEFAULT_FILENAME_TEMPLATE, "CONVERTED", None),
+    (SettingsKeys.DEFAULT_CUSTOM_SUFFIX, "", str),
+    (SettingsKeys.DEFAULT_AUTO_INCREMENT, True, bool),
+    (SettingsKeys.SHOW_PERFORMANCE_MONITOR, True, bool),
+    (SettingsKeys.PERFORMANCE_SHOW_CPU, True, bool),
+    (SettingsKeys.PERFORMANCE_SHOW_RAM, True, bool),
+    (SettingsKeys.PERFORMANCE_UPDATE_INTERVAL, 2000, int),
+)
+
 
 class AppSettingsController(QObject):
     """
@@ -79,16 +126,177 @@ class AppSettingsController(QObject):
     preview_changed = Signal()
     defaults_changed = Signal()
     clear_caches_requested = Signal()
+
+    # Idle time before buffered setting writes are flushed to QSettings
+    WRITE_DEBOUNCE_MS = 300
+
     def __init__(self, settings: Optional[QSettings] = None):
         """
         Initialize settings controller.
 
         Args:
-            settings: Optional QSettings instance. If None, creates default
+            settings: Optional QSettings instance. If None, opens the INI-backed
                      QSettings for "ConverterX". Pass custom instance for testing.
         """
         super().__init__()
-        self.settings = settings or QSettings("ConverterX", "AppSettings")
+        self.settings = settings or self._open_default_settings()
+
+        # In-memory cache of QSettings values {key: value}, filled lazily on first read
+        # and kept in sync by the setters. Avoids a QSettings round-trip per getter call.
+        self._cache: dict[str, Any] = {}
+
+        # Debounced writes: rapid setter calls (e.g. slider drags) are buffered
+        # and written to QSettings once the burst is over
+        self._pending_writes: dict[str, Any] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.WRITE_DEBOUNCE_MS)
+        self._flush_timer.timeout.connect(self._flush_writes)
+
+        # Names of *_changed signals already scheduled for this event-loop turn
+        self._pending_emits: set[str] = set()
+
+        # Runtime-computed defaults, resolved once. The thread count is taken
+        # before MainWindow applies the stored pool size, so it stays the system default.
+        self._default_thread_count = QThreadPool.globalInstance().maxThreadCount()
+        self._default_output_folder = str(Path.home() / "Pictures" / "Converted")
+
+    @staticmethod
+    def _open_default_settings() -> QSettings:
+        """
+        Open the app settings as an INI file in the user config directory.
+
+        NativeFormat is the Registry on Windows, where every uncached key
+        access is a Registry API call; an INI file is parsed once by Qt.
+        Settings saved by older versions in the native store are copied
+        over once; a marker key records the attempt (even when nothing was
+        copied) so later startups never open the native store.
+
+        Returns:
+            INI-backed QSettings
+        """
+        settings = QSettings(QSettings.IniFormat, QSettings.UserScope, "ConverterX", "AppSettings")
+
+        if not settings.value(SettingsKeys.SETTINGS_MIGRATED, False, type=bool):
+            native = QSettings("ConverterX", "AppSettings")
+            if native.fileName() != settings.fileName():  # Linux native is already INI
+                # Keys already in the INI file are newer than the native copy
+                existing = set(settings.allKeys())
+                keys = [key for key in native.allKeys() if key not in existing]
+                for key in keys:
+                    settings.setValue(key, native.value(key))
+                if keys:
+                    logger.info(
+                        f"Migrated {len(keys)} settings from {native.fileName()} to {settings.fileName()}",
+                        source="AppSettings"
+                    )
+            settings.setValue(SettingsKeys.SETTINGS_MIGRATED, True)
+
+        return settings
+
+    def _get_cached(self, key: str, default: Any, type_: Optional[type] = None) -> Any:
+        """
+        Read a setting through the in-memory cache.
+
+        Args:
+            key: SettingsKeys constant
+            default: Value returned when the key is not stored
+            type_: Optional type QSettings should coerce the value to
+
+        Returns:
+            Cached value, or the value read from QSettings on first access
+        """
+        value = self._cache.get(key)  # QSettings never yields None when given a default
+        if value is not None:
+            return value
+
+        if type_ is None:
+            value = self.settings.value(key, default)
+        else:
+            value = self.settings.value(key, default, type=type_)
+        self._cache[key] = value
+        return value
+
+    def _prime_cache(self) -> None:
+        """Load every known setting into the read cache in a single pass."""
+        cache = self._cache
+        value = self.settings.value
+        for key, default, type_ in _ALL_KEYS:
+            if key not in cache:
+                cache[key] = value(key, default) if type_ is None else value(key, default, type=type_)
+
+        # Settings whose defaults are computed at runtime
+        self.get_threadpool_max_threads()
+        self.get_default_custom_output_folder()
+
+    def _store(self, key: str, value: Any) -> None:
+        """Update the cache immediately and queue a debounced QSettings write."""
+        self._cache[key] = value
+        self._pending_writes[key] = value
+        self._flush_timer.start()  # Restarts the countdown on every write
+
+    def _flush_writes(self) -> None:
+        """Write all buffered settings to QSettings (one setValue per key)."""
+        for key, value in self._pending_writes.items():
+            self.settings.setValue(key, value)
+        self._pending_writes.clear()
+
+    def _set_int(self, name: str, key: str, value: int, low: int, high: int, signal_name: str) -> None:
+        """
+        Validate and store an integer setting, then queue its change signal.
+
+        Args:
+            name: Setting name used in error messages
+            key: SettingsKeys constant
+            value: New value
+            low: Minimum allowed value (inclusive)
+            high: Maximum allowed value (inclusive)
+            signal_name: Signal to queue, e.g. "preview_changed"
+
+        Raises:
+            ValueError: If value is not an int or is outside [low, high]
+        """
+        # Exact type check: also rejects bool, which isinstance(value, int) allows
+        if type(value) is not int:
+            raise ValueError(f"{name} must be an integer")
+
+        if not low <= value <= high:
+            raise ValueError(f"{name} must be between {low} and {high}")
+
+        self._store(key, value)
+        self._queue_emit(signal_name)
+
+    def _queue_emit(self, signal_name: str) -> None:
+        """
+        Emit a *_changed signal once per event-loop turn.
+
+        Several setters called back to back (dialog apply, reset) then
+        trigger connected slots once instead of once per setter.
+
+        Args:
+            signal_name: Attribute name of the signal, e.g. "preview_changed"
+        """
+        if signal_name in self._pending_emits:
+            return
+        self._pending_emits.add(signal_name)
+        QTimer.singleShot(0, lambda: self._do_emit(signal_name))
+
+    def _do_emit(self, signal_name: str) -> None:
+        """Clear the pending flag and fire the queued signal."""
+        self._pending_emits.discard(signal_name)
+        getattr(self, signal_name).emit()
+
+    def flush(self) -> None:
+        """
+        Write any pending settings and sync them to disk.
+
+        Call on application shutdown so debounced writes aren't lost. This is
+        the only explicit sync(); relying on the QSettings destructor would
+        leave the final write to garbage-collection timing.
+        """
+        self._flush_timer.stop()
+        self._flush_writes()
+        self.settings.sync()
 
     # ============================================================
     # PERFORMANCE SETTINGS - Getters
@@ -101,12 +309,7 @@ class AppSettingsController(QObject):
         Returns:
             Number of images converted simultaneously (1-16, default 4)
         """
-        value = self.settings.value(
-            SettingsKeys.MAX_CONCURRENT_WORKERS,
-            4,  # Default
-            type=int
-        )
-        return cast(int, value)  # Type assertion for type checker
+        return self._get_cached(SettingsKeys.MAX_CONCURRENT_WORKERS, 4, int)
 
     def get_threadpool_max_threads(self) -> int:
         """
@@ -115,13 +318,7 @@ class AppSettingsController(QObject):
         Returns:
             Max threads for thumbnails/previews (1-32, default is system max)
         """
-        default = QThreadPool.globalInstance().maxThreadCount()
-        value = self.settings.value(
-            SettingsKeys.THREADPOOL_MAX_THREADS,
-            default,
-            type=int
-        )
-        return cast(int, value)  # Type assertion for type checker
+        return self._get_cached(SettingsKeys.THREADPOOL_MAX_THREADS, self._default_thread_count, int)
 
     # ============================================================
     # PREVIEW SETTINGS - Getters
@@ -134,12 +331,7 @@ class AppSettingsController(QObject):
         Returns:
             Number of preview images kept in memory (1-50, default 10)
         """
-        value = self.settings.value(
-            SettingsKeys.PREVIEW_CACHE_SIZE,
-            10,  # Default
-            type=int
-        )
-        return cast(int, value)  # Type assertion for type checker
+        return self._get_cached(SettingsKeys.PREVIEW_CACHE_SIZE, 10, int)
 
     def get_hd_cache_size(self) -> int:
         """
@@ -148,12 +340,7 @@ class AppSettingsController(QObject):
         Returns:
             Number of full-resolution images kept in memory (1-20, default 2)
         """
-        value = self.settings.value(
-            SettingsKeys.HD_CACHE_SIZE,
-            2,  # Default
-            type=int
-        )
-        return cast(int, value)  # Type assertion for type checker
+        return self._get_cached(SettingsKeys.HD_CACHE_SIZE, 2, int)
 
     def get_preview_max_dimension(self) -> int:
         """
@@ -162,12 +349,7 @@ class AppSettingsController(QObject):
         Returns:
             Max width/height for preview mode in pixels (720-4096, default 1500)
         """
-        value = self.settings.value(
-            SettingsKeys.PREVIEW_MAX_DIMENSION,
-            1500,  # Default
-            type=int
-        )
-        return cast(int, value)  # Type assertion for type checker
+        return self._get_cached(SettingsKeys.PREVIEW_MAX_DIMENSION, 1500, int)
 
     def get_out_preview_debounce(self) -> int:
         """
@@ -176,12 +358,7 @@ class AppSettingsController(QObject):
         Returns:
             Delay before regenerating output preview in milliseconds (100-2000, default 250)
         """
-        value = self.settings.value(
-            SettingsKeys.OUTPUT_PREVIEW_DEBOUNCE,
-            250,  # Default
-            type=int
-        )
-        return cast(int, value)  # Type assertion for type checker
+        return self._get_cached(SettingsKeys.OUTPUT_PREVIEW_DEBOUNCE, 250, int)
 
     def get_output_preview_cache_size(self) -> int:
         """
@@ -190,12 +367,7 @@ class AppSettingsController(QObject):
         Returns:
             Number of output previews kept in memory (1-20, default 2)
         """
-        value = self.settings.value(
-            SettingsKeys.OUTPUT_PREVIEW_CACHE_SIZE,
-            2,  # Default
-            type=int
-        )
-        return cast(int, value)
+        return self._get_cached(SettingsKeys.OUTPUT_PREVIEW_CACHE_SIZE, 2, int)
 
     # ============================================================
     # DEFAULTS SETTINGS - Getters
@@ -208,12 +380,7 @@ class AppSettingsController(QObject):
         Returns:
             Default quality setting (1-100, default 85)
         """
-        value = self.settings.value(
-            SettingsKeys.DEFAULT_QUALITY,
-            85,  # Default
-            type=int
-        )
-        return cast(int, value)  # Type assertion for type checker
+        return self._get_cached(SettingsKeys.DEFAULT_QUALITY, 85, int)
 
     def get_default_output_format(self) -> ImageFormat:
         """
@@ -222,65 +389,40 @@ class AppSettingsController(QObject):
         Returns:
             Default output format enum (default ImageFormat.WEBP)
         """
-        format_str = self.settings.value(
-            SettingsKeys.DEFAULT_OUTPUT_FORMAT,
-            "WEBP",  # Default
-            type=str
+        # Convert stored string to ImageFormat enum
+        return _FORMAT_MAP.get(
+            self._get_cached(SettingsKeys.DEFAULT_OUTPUT_FORMAT, "WEBP", str),
+            ImageFormat.WEBP
         )
 
-        # Cast to str for type checker
-        format_str = cast(str, format_str)
-
-        # Convert string to ImageFormat enum
-        format_map = {
-            "WEBP": ImageFormat.WEBP,
-            "AVIF": ImageFormat.AVIF,
-            "JPEG": ImageFormat.JPEG,
-            "PNG": ImageFormat.PNG
-        }
-
-        return format_map.get(format_str, ImageFormat.WEBP)
-
     def get_default_output_location_mode(self) -> OutputLocationMode:
-        raw = self.settings.value(SettingsKeys.DEFAULT_OUTPUT_LOCATION_MODE, "custom")
+        raw = self._get_cached(SettingsKeys.DEFAULT_OUTPUT_LOCATION_MODE, "custom")
         mode_str: str = raw if isinstance(raw, str) else str(raw)
-        mapping: dict[str, OutputLocationMode] = {
-            "custom": OutputLocationMode.CUSTOM_FOLDER,
-            "same": OutputLocationMode.SAME_AS_SOURCE,
-            "ask": OutputLocationMode.ASK_EVERY_TIME,
-        }
-        return mapping.get(mode_str, OutputLocationMode.CUSTOM_FOLDER)
+        return _LOCATION_MAP.get(mode_str, OutputLocationMode.CUSTOM_FOLDER)
 
     def get_default_custom_output_folder(self) -> Path:
         # Default to ~/Pictures/Converted
-        default_path = Path.home() / "Pictures" / "Converted"
-        raw = self.settings.value(
+        raw = self._get_cached(
             SettingsKeys.DEFAULT_CUSTOM_OUTPUT_FOLDER,
-            str(default_path)
+            self._default_output_folder
         )
         path_str: str = raw if isinstance(raw, str) else str(raw)
         return Path(path_str)
 
     def get_default_enable_filename_suffix(self) -> bool:
-        return bool(self.settings.value(SettingsKeys.DEFAULT_ENABLE_FILENAME_SUFFIX, True, type=bool))
+        return bool(self._get_cached(SettingsKeys.DEFAULT_ENABLE_FILENAME_SUFFIX, True, bool))
 
     def get_default_filename_template(self) -> FilenameTemplate:
         # Coerce to str for type checkers, then map to enum
-        raw = self.settings.value(SettingsKeys.DEFAULT_FILENAME_TEMPLATE, "CONVERTED")
+        raw = self._get_cached(SettingsKeys.DEFAULT_FILENAME_TEMPLATE, "CONVERTED")
         name: str = raw if isinstance(raw, str) else str(raw)
-        mapping: dict[str, FilenameTemplate] = {
-            "CONVERTED": FilenameTemplate.CONVERTED,
-            "FORMAT": FilenameTemplate.FORMAT,
-            "QUALITY": FilenameTemplate.QUALITY,
-            "CUSTOM": FilenameTemplate.CUSTOM,
-        }
-        return mapping.get(name, FilenameTemplate.CONVERTED)
+        return _TEMPLATE_MAP.get(name, FilenameTemplate.CONVERTED)
 
     def get_default_custom_suffix(self) -> str:
-        return self.settings.value(SettingsKeys.DEFAULT_CUSTOM_SUFFIX, "", type=str) or ""
+        return self._get_cached(SettingsKeys.DEFAULT_CUSTOM_SUFFIX, "", str) or ""
 
     def get_default_auto_increment(self) -> bool:
-        return bool(self.settings.value(SettingsKeys.DEFAULT_AUTO_INCREMENT, True, type=bool))
+        return bool(self._get_cached(SettingsKeys.DEFAULT_AUTO_INCREMENT, True, bool))
 
     # ============================================================
     # PERFORMANCE SETTINGS - Setters
@@ -296,14 +438,7 @@ class AppSettingsController(QObject):
         Raises:
             ValueError: If value is outside valid range
         """
-        if not isinstance(value, int):
-            raise ValueError("max_concurrent_workers must be an integer")
-
-        if not 1 <= value <= 16:
-            raise ValueError("max_concurrent_workers must be between 1 and 16")
-
-        self.settings.setValue(SettingsKeys.MAX_CONCURRENT_WORKERS, value)
-        self.performance_changed.emit()
+        self._set_int("max_concurrent_workers", SettingsKeys.MAX_CONCURRENT_WORKERS, value, 1, 16, "performance_changed")
 
     def set_threadpool_max_threads(self, value: int) -> None:
         """
@@ -315,14 +450,7 @@ class AppSettingsController(QObject):
         Raises:
             ValueError: If value is outside valid range
         """
-        if not isinstance(value, int):
-            raise ValueError("threadpool_max_threads must be an integer")
-
-        if not 1 <= value <= 32:
-            raise ValueError("threadpool_max_threads must be between 1 and 32")
-
-        self.settings.setValue(SettingsKeys.THREADPOOL_MAX_THREADS, value)
-        self.performance_changed.emit()
+        self._set_int("threadpool_max_threads", SettingsKeys.THREADPOOL_MAX_THREADS, value, 1, 32, "performance_changed")
 
     # ============================================================
     # Performance Monitor Settings
@@ -330,48 +458,44 @@ class AppSettingsController(QObject):
 
     def get_show_performance_monitor(self) -> bool:
         """Get whether performance monitor is enabled."""
-        value = self.settings.value(SettingsKeys.SHOW_PERFORMANCE_MONITOR, True, type=bool)
-        return bool(value)  # Explicit cast to bool
+        return bool(self._get_cached(SettingsKeys.SHOW_PERFORMANCE_MONITOR, True, bool))
 
     def set_show_performance_monitor(self, enabled: bool):
         """Set whether performance monitor is enabled."""
-        self.settings.setValue(SettingsKeys.SHOW_PERFORMANCE_MONITOR, enabled)
-        self.performance_changed.emit()
+        self._store(SettingsKeys.SHOW_PERFORMANCE_MONITOR, enabled)
+        self._queue_emit("performance_changed")
         logger.debug(f"Performance monitor enabled: {enabled}", source="AppSettings")
 
     def get_performance_show_cpu(self) -> bool:
         """Get whether to show CPU usage."""
-        value = self.settings.value(SettingsKeys.PERFORMANCE_SHOW_CPU, True, type=bool)
-        return bool(value)  # Explicit cast to bool
+        return bool(self._get_cached(SettingsKeys.PERFORMANCE_SHOW_CPU, True, bool))
 
     def set_performance_show_cpu(self, enabled: bool):
         """Set whether to show CPU usage."""
-        self.settings.setValue(SettingsKeys.PERFORMANCE_SHOW_CPU, enabled)
-        self.performance_changed.emit()
+        self._store(SettingsKeys.PERFORMANCE_SHOW_CPU, enabled)
+        self._queue_emit("performance_changed")
         logger.debug(f"Performance show CPU: {enabled}", source="AppSettings")
 
     def get_performance_show_ram(self) -> bool:
         """Get whether to show RAM usage."""
-        value = self.settings.value(SettingsKeys.PERFORMANCE_SHOW_RAM, True, type=bool)
-        return bool(value)  # Explicit cast to bool
+        return bool(self._get_cached(SettingsKeys.PERFORMANCE_SHOW_RAM, True, bool))
 
     def set_performance_show_ram(self, enabled: bool):
         """Set whether to show RAM usage."""
-        self.settings.setValue(SettingsKeys.PERFORMANCE_SHOW_RAM, enabled)
-        self.performance_changed.emit()
+        self._store(SettingsKeys.PERFORMANCE_SHOW_RAM, enabled)
+        self._queue_emit("performance_changed")
         logger.debug(f"Performance show RAM: {enabled}", source="AppSettings")
 
     def get_performance_update_interval(self) -> int:
         """Get performance monitor update interval in milliseconds."""
-        value = self.settings.value(SettingsKeys.PERFORMANCE_UPDATE_INTERVAL, 2000, type=int)
-        return cast(int, value)  # Use cast() like other methods
+        return self._get_cached(SettingsKeys.PERFORMANCE_UPDATE_INTERVAL, 2000, int)
 
     def set_performance_update_interval(self, interval_ms: int):
         """Set performance monitor update interval in milliseconds."""
         # Clamp to 1-5 seconds
         interval_ms = max(1000, min(5000, interval_ms))
-        self.settings.setValue(SettingsKeys.PERFORMANCE_UPDATE_INTERVAL, interval_ms)
-        self.performance_changed.emit()
+        self._store(SettingsKeys.PERFORMANCE_UPDATE_INTERVAL, interval_ms)
+        self._queue_emit("performance_changed")
         logger.debug(f"Performance update interval: {interval_ms}ms", source="AppSettings")
 
     # ============================================================
@@ -388,14 +512,7 @@ class AppSettingsController(QObject):
         Raises:
             ValueError: If value is outside valid range
         """
-        if not isinstance(value, int):
-            raise ValueError("preview_cache_size must be an integer")
-
-        if not 1 <= value <= 50:
-            raise ValueError("preview_cache_size must be between 1 and 50")
-
-        self.settings.setValue(SettingsKeys.PREVIEW_CACHE_SIZE, value)
-        self.preview_changed.emit()
+        self._set_int("preview_cache_size", SettingsKeys.PREVIEW_CACHE_SIZE, value, 1, 50, "preview_changed")
 
     def set_hd_cache_size(self, value: int) -> None:
         """
@@ -407,14 +524,7 @@ class AppSettingsController(QObject):
         Raises:
             ValueError: If value is outside valid range
         """
-        if not isinstance(value, int):
-            raise ValueError("hd_cache_size must be an integer")
-
-        if not 1 <= value <= 20:
-            raise ValueError("hd_cache_size must be between 1 and 20")
-
-        self.settings.setValue(SettingsKeys.HD_CACHE_SIZE, value)
-        self.preview_changed.emit()
+        self._set_int("hd_cache_size", SettingsKeys.HD_CACHE_SIZE, value, 1, 20, "preview_changed")
 
     def set_preview_max_dimension(self, value: int) -> None:
         """
@@ -426,14 +536,7 @@ class AppSettingsController(QObject):
         Raises:
             ValueError: If value is outside valid range
         """
-        if not isinstance(value, int):
-            raise ValueError("preview_max_dimension must be an integer")
-
-        if not 720 <= value <= 4096:
-            raise ValueError("preview_max_dimension must be between 720 and 4096")
-
-        self.settings.setValue(SettingsKeys.PREVIEW_MAX_DIMENSION, value)
-        self.preview_changed.emit()
+        self._set_int("preview_max_dimension", SettingsKeys.PREVIEW_MAX_DIMENSION, value, 720, 4096, "preview_changed")
 
     def set_out_preview_debounce(self, value: int) -> None:
         """
@@ -445,14 +548,7 @@ class AppSettingsController(QObject):
         Raises:
             ValueError: If value is outside valid range
         """
-        if not isinstance(value, int):
-            raise ValueError("out_preview_debounce must be an integer")
-
-        if not 50 <= value <= 2000:
-            raise ValueError("out_preview_debounce must be between 50 and 2000")
-
-        self.settings.setValue(SettingsKeys.OUTPUT_PREVIEW_DEBOUNCE, value)
-        self.preview_changed.emit()
+        self._set_int("out_preview_debounce", SettingsKeys.OUTPUT_PREVIEW_DEBOUNCE, value, 50, 2000, "preview_changed")
 
     def set_output_preview_cache_size(self, value: int) -> None:
         """
@@ -464,14 +560,7 @@ class AppSettingsController(QObject):
         Raises:
             ValueError: If value is outside valid range
         """
-        if not isinstance(value, int):
-            raise ValueError("output_preview_cache_size must be an integer")
-
-        if not 1 <= value <= 20:
-            raise ValueError("output_preview_cache_size must be between 1 and 20")
-
-        self.settings.setValue(SettingsKeys.OUTPUT_PREVIEW_CACHE_SIZE, value)
-        self.preview_changed.emit()
+        self._set_int("output_preview_cache_size", SettingsKeys.OUTPUT_PREVIEW_CACHE_SIZE, value, 1, 20, "preview_changed")
 
     def request_clear_caches(self) -> None:
         """
@@ -497,14 +586,7 @@ class AppSettingsController(QObject):
         Raises:
             ValueError: If value is outside valid range
         """
-        if not isinstance(value, int):
-            raise ValueError("default_quality must be an integer")
-
-        if not 1 <= value <= 100:
-            raise ValueError("default_quality must be between 1 and 100")
-
-        self.settings.setValue(SettingsKeys.DEFAULT_QUALITY, value)
-        self.defaults_changed.emit()
+        self._set_int("default_quality", SettingsKeys.DEFAULT_QUALITY, value, 1, 100, "defaults_changed")
 
     def set_default_output_format(self, value: ImageFormat) -> None:
         """
@@ -520,44 +602,44 @@ class AppSettingsController(QObject):
             raise ValueError("default_output_format must be an ImageFormat enum")
 
         # Store as string for QSettings compatibility
-        self.settings.setValue(SettingsKeys.DEFAULT_OUTPUT_FORMAT, value.name)
-        self.defaults_changed.emit()
+        self._store(SettingsKeys.DEFAULT_OUTPUT_FORMAT, value.name)
+        self._queue_emit("defaults_changed")
 
     def set_default_output_location_mode(self, value: OutputLocationMode) -> None:
         if not isinstance(value, OutputLocationMode):
             raise ValueError("default_output_location_mode must be an OutputLocationMode enum")
-        self.settings.setValue(SettingsKeys.DEFAULT_OUTPUT_LOCATION_MODE, value.value)  # "custom"|"same"|"ask"
-        self.defaults_changed.emit()
+        self._store(SettingsKeys.DEFAULT_OUTPUT_LOCATION_MODE, value.value)  # "custom"|"same"|"ask"
+        self._queue_emit("defaults_changed")
 
     def set_default_custom_output_folder(self, path: Path) -> None:
         if not isinstance(path, Path):
             raise ValueError("default_custom_output_folder must be a Path")
-        self.settings.setValue(SettingsKeys.DEFAULT_CUSTOM_OUTPUT_FOLDER, str(path))
-        self.defaults_changed.emit()
+        self._store(SettingsKeys.DEFAULT_CUSTOM_OUTPUT_FOLDER, str(path))
+        self._queue_emit("defaults_changed")
 
     def set_default_enable_filename_suffix(self, enabled: bool) -> None:
         if not isinstance(enabled, bool):
             raise ValueError("enable_filename_suffix must be a bool")
-        self.settings.setValue(SettingsKeys.DEFAULT_ENABLE_FILENAME_SUFFIX, enabled)
-        self.defaults_changed.emit()
+        self._store(SettingsKeys.DEFAULT_ENABLE_FILENAME_SUFFIX, enabled)
+        self._queue_emit("defaults_changed")
 
     def set_default_filename_template(self, value: FilenameTemplate) -> None:
         if not isinstance(value, FilenameTemplate):
             raise ValueError("filename_template must be a FilenameTemplate enum")
-        self.settings.setValue(SettingsKeys.DEFAULT_FILENAME_TEMPLATE, value.name)
-        self.defaults_changed.emit()
+        self._store(SettingsKeys.DEFAULT_FILENAME_TEMPLATE, value.name)
+        self._queue_emit("defaults_changed")
 
     def set_default_custom_suffix(self, text: str) -> None:
         if not isinstance(text, str):
             raise ValueError("custom_suffix must be a string")
-        self.settings.setValue(SettingsKeys.DEFAULT_CUSTOM_SUFFIX, text)
-        self.defaults_changed.emit()
+        self._store(SettingsKeys.DEFAULT_CUSTOM_SUFFIX, text)
+        self._queue_emit("defaults_changed")
 
     def set_default_auto_increment(self, value: bool) -> None:
         if not isinstance(value, bool):
             raise ValueError("auto_increment must be a bool")
-        self.settings.setValue(SettingsKeys.DEFAULT_AUTO_INCREMENT, value)
-        self.defaults_changed.emit()
+        self._store(SettingsKeys.DEFAULT_AUTO_INCREMENT, value)
+        self._queue_emit("defaults_changed")
 
     # ============================================================
     # UTILITY METHODS
@@ -567,14 +649,19 @@ class AppSettingsController(QObject):
         """
         Clear all settings and revert to defaults.
 
-        Emits all change signals to notify components.
+        Emits all change signals (once each) to notify components.
         """
+        self._flush_timer.stop()
+        self._pending_writes.clear()
         self.settings.clear()
+        # Keep the migration marker, or the next start would re-import old native settings
+        self.settings.setValue(SettingsKeys.SETTINGS_MIGRATED, True)
+        self._cache.clear()
 
         # Emit all signals to notify components of reset
-        self.performance_changed.emit()
-        self.preview_changed.emit()
-        self.defaults_changed.emit()
+        self._queue_emit("performance_changed")
+        self._queue_emit("preview_changed")
+        self._queue_emit("defaults_changed")
 
     def get_all_settings(self) -> dict:
         """
@@ -585,15 +672,19 @@ class AppSettingsController(QObject):
         Returns:
             Dictionary with all setting names and values
         """
+        self._prime_cache()
+        cache = self._cache
         return {
-            'max_concurrent_workers': self.get_max_concurrent_workers(),
-            'threadpool_max_threads': self.get_threadpool_max_threads(),
-            'preview_cache_size': self.get_preview_cache_size(),
-            'hd_cache_size': self.get_hd_cache_size(),
-            'preview_max_dimension': self.get_preview_max_dimension(),
-            'out_preview_debounce': self.get_out_preview_debounce(),
-            'default_quality': self.get_default_quality(),
-            'default_output_format': self.get_default_output_format().name
+            'max_concurrent_workers': cache[SettingsKeys.MAX_CONCURRENT_WORKERS],
+            'threadpool_max_threads': cache[SettingsKeys.THREADPOOL_MAX_THREADS],
+            'preview_cache_size': cache[SettingsKeys.PREVIEW_CACHE_SIZE],
+            'hd_cache_size': cache[SettingsKeys.HD_CACHE_SIZE],
+            'preview_max_dimension': cache[SettingsKeys.PREVIEW_MAX_DIMENSION],
+            'out_preview_debounce': cache[SettingsKeys.OUTPUT_PREVIEW_DEBOUNCE],
+            'default_quality': cache[SettingsKeys.DEFAULT_QUALITY],
+            'default_output_format': _FORMAT_MAP.get(
+                cache[SettingsKeys.DEFAULT_OUTPUT_FORMAT], ImageFormat.WEBP
+            ).name
         }
 
     def __repr__(self) -> str:
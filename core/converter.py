@@ -1,11 +1,78 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from PIL import Image, ImageOps
-from typing import Optional, Tuple
+from PIL import Image, ImageOps, features
+from typing import Dict, List, Optional, Sequence, Tuple
 from core.format_settings import ConversionSettings, ResizeMode, ImageFormat
 from utils.logger import logger, LogLevel
 import time
 import io
 import math
+import multiprocessing
+import os
+import threading
+
+
+# EXIF Orientation value -> transpose that displays the image upright
+# (same mapping as ImageOps.exif_transpose)
+_ORIENTATION_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+
+# Optional libimagequant support (not in the PyPI wheels; used for GIF palettes when present)
+_HAVE_LIBIMAGEQUANT = bool(features.check_feature('libimagequant'))
+
+# resize() reducing_gap: integer reduce() first while the remaining scale stays >= 3×
+REDUCING_GAP = 3.0
+
+# Conversions running in this process (BatchProcessor runs several at once).
+# The target-size search only moves encodes onto extra threads while that
+# leaves cores idle; otherwise they would just compete with other workers.
+_active_conversions = 0
+_active_conversions_lock = threading.Lock()
+
+
+@contextmanager
+def _conversion_slot():
+    """Count one running conversion for _spare_cores()."""
+    global _active_conversions
+    with _active_conversions_lock:
+        _active_conversions += 1
+    try:
+        yield
+    finally:
+        with _active_conversions_lock:
+            _active_conversions -= 1
+
+
+def _spare_cores() -> int:
+    """CPU cores not taken by a running conversion."""
+    return (os.cpu_count() or 1) - _active_conversions
+
+
+def _init_worker() -> None:
+    """
+    Set up a spawned worker process: no log file, HEIF and AVIF plugins registered.
+
+    Importing this module opened a log file for the worker, whose messages
+    never reach the GUI log; results travel back through the return value.
+    main.py registers the plugins for the GUI process, but 'spawn' workers
+    start from a fresh interpreter that only imports this module.
+    """
+    logger.disable_file_output()
+
+    from pillow_heif import register_heif_opener
+    register_heif_opener()
+
+    import pillow_avif  # noqa: F401 - registers the AVIF plugin on import
 
 
 class ImageConverter:
@@ -15,33 +82,30 @@ class ImageConverter:
     def convert_image(
             input_path: Path,
             output_path: Path,
-            settings: ConversionSettings
+            settings: ConversionSettings,
+            preview_max: Optional[int] = None
     ) -> Tuple[bool, str, Optional[int]]:
-        """Convert an image file to specified format."""
+        """
+        Convert an image file to specified format.
+
+        Args:
+            input_path: Source image
+            output_path: Destination file
+            settings: Conversion settings
+            preview_max: Optional largest dimension the result is needed at
+                (preview use). The output is scaled to fit it, and JPEG inputs
+                are decoded at a reduced DCT scale (1/2, 1/4 or 1/8).
+        """
         start_time = time.time()
 
         try:
-            with Image.open(input_path) as img:
-                img = ImageOps.exif_transpose(img)
-                original_size = img.size
-
-                logger.log(f"Original image: {original_size[0]}x{original_size[1]}", LogLevel.DEBUG, "Converter")
-
-                # Apply resize if configured (happens first, before format conversion)
-                img = ImageConverter.apply_resize(img, settings)
-
-                if img.size != original_size:
-                    logger.log(f"Resized to: {img.size[0]}x{img.size[1]}", LogLevel.INFO, "Converter")
-
-                # ==========================================
-                # Format-specific preparation
-                # ==========================================
-                img = ImageConverter._prepare_for_format(img, settings)
+            with _conversion_slot(), Image.open(input_path) as img:
+                img = ImageConverter._prepare_image(img, settings, preview_max)
 
                 output_path.parent.mkdir(parents=True, exist_ok=True)
 
                 # Target size mode - iterative compression
-                if settings.target_size_kb and settings.output_format not in [ImageFormat.PNG, ImageFormat.BMP, ImageFormat.GIF, ImageFormat.ICO]:
+                if ImageConverter._uses_target_size(settings):
                     success, msg, size = ImageConverter._compress_to_target_size(
                         img, output_path, settings
                     )
@@ -49,16 +113,10 @@ class ImageConverter:
                     return (success, f"{msg} ({elapsed:.2f}s)", size)
 
                 # Normal quality-based compression
-                save_kwargs = settings.to_pillow_kwargs()
-
-                # Special handling for ICO: Save with explicit size list
-                if settings.output_format == ImageFormat.ICO:
-                    current_size = img.size[0]  # Image is square at this point
-                    img.save(output_path, format='ICO', sizes=[(current_size, current_size)])
-                else:
-                    img.save(output_path, **save_kwargs)
+                output_size = ImageConverter._save_and_size(
+                    img, output_path, **ImageConverter._save_kwargs(img, settings)
+                )
 
-            output_size = output_path.stat().st_size
             elapsed = time.time() - start_time
 
             return (True, f"Converted successfully in {elapsed:.2f}s", output_size)
@@ -68,114 +126,292 @@ class ImageConverter:
             return (False, f"Conversion failed: {str(e)}", None)
 
     @staticmethod
-    def apply_resize(img: Image.Image, settings: ConversionSettings) -> Image.Image:
-        """Apply resize based on settings."""
-        if settings.resize_mode == ResizeMode.NONE:
-            return img
+    def convert_image_to_bytes(
+            input_path: Path,
+            settings: ConversionSettings
+    ) -> Tuple[bool, str, Optional[memoryview]]:
+        """
+        Convert an image file and return the encoded output without touching disk.
 
-        original_width, original_height = img.size
+        Args:
+            input_path: Source image
+            settings: Conversion settings
 
-        if settings.resize_mode == ResizeMode.PERCENTAGE:
-            scale = settings.resize_percentage / 100.0
-            new_width = int(original_width * scale)
-            new_height = int(original_height * scale)
+        Returns:
+            (success, message, encoded bytes as a zero-copy memoryview or None)
+        """
+        start_time = time.time()
 
-            if (new_width, new_height) != (original_width, original_height):
-                logger.log(
-                    f"Percentage resize: {original_width}×{original_height} → {new_width}×{new_height} ({settings.resize_percentage}%)",
-                    LogLevel.INFO,
-                    "Converter"
-                )
-                return img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            return img
+        try:
+            with _conversion_slot(), Image.open(input_path) as img:
+                img = ImageConverter._prepare_image(img, settings)
 
-        elif settings.resize_mode == ResizeMode.FIT_TO_WIDTH:
-            # Resize to target width, height follows aspect ratio
-            if not settings.target_width_px:
-                logger.log("Fit to width: No target width specified", LogLevel.DEBUG, "Converter")
-                return img
+                if ImageConverter._uses_target_size(settings):
+                    buffer, _, msg = ImageConverter._encode_to_target_size(img, settings)
+                else:
+                    buffer = io.BytesIO()
+                    img.save(buffer, **ImageConverter._save_kwargs(img, settings))
+                    msg = "Converted successfully"
 
-            target_w = settings.target_width_px
-            aspect_ratio = original_width / original_height
-            new_w = target_w
-            new_h = int(target_w / aspect_ratio)
+            elapsed = time.time() - start_time
+            return (True, f"{msg} ({elapsed:.2f}s)", buffer.getbuffer())
 
-            # Don't upscale unless allowed
-            if not settings.allow_upscaling and new_w > original_width:
-                logger.log(
-                    f"Fit to width: Target {target_w}px exceeds original {original_width}px, upscaling disabled",
-                    LogLevel.DEBUG,
-                    "Converter"
-                )
-                return img
+        except Exception as e:
+            logger.log(f"Conversion error: {str(e)}", LogLevel.ERROR, "Converter")
+            return (False, f"Conversion failed: {str(e)}", None)
 
-            if (new_w, new_h) != (original_width, original_height):
-                logger.log(
-                    f"Fit to width: {original_width}×{original_height} → {new_w}×{new_h}",
-                    LogLevel.INFO,
-                    "Converter"
-                )
-                return img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-            return img
+    @staticmethod
+    def convert_images(
+            jobs: Sequence[Tuple[Path, Path]],
+            settings: ConversionSettings,
+            max_workers: Optional[int] = None
+    ) -> List[Tuple[bool, str, Optional[int]]]:
+        """
+        Convert several files in parallel worker processes.
 
-        elif settings.resize_mode == ResizeMode.FIT_TO_HEIGHT:
-            # Resize to target height, width follows aspect ratio
-            if not settings.target_height_px:
-                logger.log("Fit to height: No target height specified", LogLevel.DEBUG, "Converter")
-                return img
+        Each worker process runs convert_image independently, so resize and
+        the Python-level parts of encoding scale across cores instead of
+        sharing one GIL. Only paths and settings are sent to the workers.
 
-            target_h = settings.target_height_px
-            aspect_ratio = original_width / original_height
-            new_h = target_h
-            new_w = int(target_h * aspect_ratio)
+        Args:
+            jobs: (input_path, output_path) pairs
+            settings: Conversion settings applied to every job
+            max_workers: Worker process count (default: CPU count)
 
-            # Don't upscale unless allowed
-            if not settings.allow_upscaling and new_h > original_height:
-                logger.log(
-                    f"Fit to height: Target {target_h}px exceeds original {original_height}px, upscaling disabled",
-                    LogLevel.DEBUG,
-                    "Converter"
-                )
-                return img
+        Returns:
+            convert_image results, in the same order as jobs
+        """
+        if len(jobs) <= 1:
+            return [ImageConverter.convert_image(src, dst, settings) for src, dst in jobs]
+
+        # 'spawn' everywhere: forking the multi-threaded GUI process could
+        # inherit locks held by Qt or logger threads
+        context = multiprocessing.get_context('spawn')
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker) as pool:
+            return list(pool.map(
+                ImageConverter.convert_image,
+                [src for src, _ in jobs],
+                [dst for _, dst in jobs],
+                repeat(settings)
+            ))
 
-            if (new_w, new_h) != (original_width, original_height):
-                logger.log(
-                    f"Fit to height: {original_width}×{original_height} → {new_w}×{new_h}",
-                    LogLevel.INFO,
-                    "Converter"
-                )
-                return img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+    @staticmethod
+    def _prepare_image(
+            img: Image.Image,
+            settings: ConversionSettings,
+            preview_max: Optional[int] = None
+    ) -> Image.Image:
+        """
+        Run the shared pipeline on a freshly opened image: orientation, resize, format prep.
+
+        Args:
+            img: Image straight from Image.open (not yet loaded)
+            settings: Conversion settings
+            preview_max: See convert_image
+
+        Returns:
+            Image ready to be saved in the target format
+        """
+        orientation = img.getexif().get(0x0112, 1)  # 0x0112 = Orientation
+        transposed = orientation in (5, 6, 7, 8)  # Rotated by 90° / 270°
+
+        # Work out the final size from the full-size source dimensions
+        # (as displayed), before draft() can shrink img.size
+        original_size = img.size[::-1] if transposed else img.size
+        if settings.output_format == ImageFormat.ICO:
+            # The ICO step scales to ico_size itself; a generic resize first
+            # would only add a second LANCZOS pass. draft() still decodes
+            # JPEGs near the icon size.
+            target_size = None
+            draft_size = (settings.ico_size, settings.ico_size)
+        else:
+            target_size = ImageConverter._target_dimensions(*original_size, settings)
+            if preview_max and max(target_size) > preview_max:
+                scale = preview_max / max(target_size)
+                target_size = (max(1, int(target_size[0] * scale)), max(1, int(target_size[1] * scale)))
+            draft_size = target_size
+
+        if img.format == 'JPEG':
+            ImageConverter._draft_jpeg(img, draft_size, transposed)
+
+        logger.log(f"Original image: {original_size[0]}x{original_size[1]}", LogLevel.DEBUG, "Converter")
+
+        # JPEG output of an image with alpha/palette: flatten to RGB first.
+        # Resizing RGBA makes Pillow premultiply and un-premultiply the whole
+        # image around LANCZOS, and a 'P' image can only be resized NEAREST;
+        # 3-channel RGB avoids both. Other formats keep their mode until later.
+        if settings.output_format == ImageFormat.JPEG and img.mode in ('RGBA', 'LA', 'P'):
+            img = ImageConverter._prepare_for_format(img, settings)
+
+        # Apply resize if configured (happens first, before format conversion)
+        transpose_method = _ORIENTATION_TRANSPOSE.get(orientation)
+        if transpose_method is not None and target_size not in (None, original_size):
+            # Resize on the stored (unrotated) pixel grid, then rotate the
+            # smaller result instead of a full-size rotated copy
+            stored_target = target_size[::-1] if transposed else target_size
+            img = ImageConverter.apply_resize(img, settings, stored_target)
+            img = img.transpose(transpose_method)
+            if 'exif' in img.info:
+                # Like exif_transpose(): drop the tag so encoders that carry the
+                # source EXIF over (AVIF, HEIF) don't rotate the output twice
+                exif = img.getexif()
+                exif.pop(0x0112, None)
+                img.info['exif'] = exif.tobytes()
+        else:
+            # exif_transpose() copies the whole image even when there is
+            # nothing to rotate, so only call it for non-default orientation
+            if orientation != 1:
+                img = ImageOps.exif_transpose(img)
+            if target_size is not None:
+                img = ImageConverter.apply_resize(img, settings, target_size)
+
+        if img.size != original_size:
+            logger.log(f"Resized to: {img.size[0]}x{img.size[1]}", LogLevel.INFO, "Converter")
+
+        # ==========================================
+        # Format-specific preparation
+        # ==========================================
+        img = ImageConverter._prepare_for_format(img, settings)
+
+        return img
+
+    @staticmethod
+    def apply_exif_orientation(img: Image.Image, orientation: Optional[int] = None) -> Image.Image:
+        """
+        Rotate/flip an image upright according to its EXIF Orientation tag.
+
+        A single transpose() from the orientation table; unlike
+        ImageOps.exif_transpose() it returns upright images as they are and
+        leaves the EXIF block untouched, so use it where the metadata is not
+        saved afterwards (thumbnails, previews).
+
+        Args:
+            img: Image to orient
+            orientation: Orientation value if already read (default: read from img)
+
+        Returns:
+            Upright image, or img itself when no transpose applies
+        """
+        if orientation is None:
+            orientation = img.getexif().get(0x0112, 1)  # 0x0112 = Orientation
+        method = _ORIENTATION_TRANSPOSE.get(orientation)
+        return img if method is None else img.transpose(method)
+
+    @staticmethod
+    def _uses_target_size(settings: ConversionSettings) -> bool:
+        """Whether settings ask for target-size compression (lossy formats only)."""
+        return bool(settings.target_size_kb) and settings.output_format not in (
+            ImageFormat.PNG, ImageFormat.BMP, ImageFormat.GIF, ImageFormat.ICO
+        )
+
+    @staticmethod
+    def _save_kwargs(img: Image.Image, settings: ConversionSettings) -> Dict:
+        """Pillow save() kwargs for a normal (quality-based) save of a prepared image."""
+        # Special handling for ICO: Save with explicit size list
+        if settings.output_format == ImageFormat.ICO:
+            current_size = img.size[0]  # Image is square at this point
+            return {'format': 'ICO', 'sizes': [(current_size, current_size)]}
+        return settings.to_pillow_kwargs()
+
+    @staticmethod
+    def apply_resize(
+            img: Image.Image,
+            settings: ConversionSettings,
+            target_size: Optional[Tuple[int, int]] = None
+    ) -> Image.Image:
+        """
+        Apply resize based on settings.
+
+        Args:
+            img: Image to resize
+            settings: Conversion settings with resize mode and targets
+            target_size: Precomputed (width, height) from _target_dimensions.
+                Needed when img was drafted to a smaller size than the source.
+
+        Returns:
+            Resized image, or img itself when no resize applies
+        """
+        if target_size is None:
+            target_size = ImageConverter._target_dimensions(img.width, img.height, settings)
+
+        if target_size == img.size:
+            if settings.resize_mode != ResizeMode.NONE:
+                logger.log("Resize target matches current size, skipped", LogLevel.DEBUG, "Converter")
             return img
 
+        logger.log(
+            f"Resize ({settings.resize_mode.value}): {img.width}×{img.height} → {target_size[0]}×{target_size[1]}",
+            LogLevel.INFO,
+            "Converter"
+        )
+        # reducing_gap lets Pillow box-reduce() by an integer factor first and run
+        # LANCZOS only on the remaining ≥3× step; the result is visually identical
+        return img.resize(target_size, Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+
+    @staticmethod
+    def _target_dimensions(width: int, height: int, settings: ConversionSettings) -> Tuple[int, int]:
+        """
+        Calculate the size the resize settings map a width × height image to.
+
+        Args:
+            width: Source width (after EXIF orientation)
+            height: Source height (after EXIF orientation)
+            settings: Conversion settings with resize mode and targets
+
+        Returns:
+            (new_width, new_height), or (width, height) when no resize applies
+        """
+        if settings.resize_mode == ResizeMode.PERCENTAGE:
+            scale = settings.resize_percentage / 100.0
+            return int(width * scale), int(height * scale)
+
+        elif settings.resize_mode == ResizeMode.FIT_TO_WIDTH:
+            # Height follows aspect ratio; don't upscale unless allowed
+            target_w = settings.target_width_px
+            if not target_w or target_w == width or (not settings.allow_upscaling and target_w > width):
+                return width, height
+            return target_w, int(target_w / (width / height))
+
+        elif settings.resize_mode == ResizeMode.FIT_TO_HEIGHT:
+            # Width follows aspect ratio; don't upscale unless allowed
+            target_h = settings.target_height_px
+            if not target_h or target_h == height or (not settings.allow_upscaling and target_h > height):
+                return width, height
+            return int(target_h * (width / height)), target_h
+
         elif settings.resize_mode == ResizeMode.FIT_TO_DIMENSIONS:
             # Fit within max width × max height box
             max_w = settings.max_width_px
             max_h = settings.max_height_px
-
             if not max_w and not max_h:
-                logger.log("Fit to dimensions: No dimensions specified", LogLevel.DEBUG, "Converter")
-                return img
-
-            new_w, new_h = ImageConverter._calculate_fit_dimensions(
-                original_width, original_height, max_w, max_h, settings.allow_upscaling
+                return width, height
+            return ImageConverter._calculate_fit_dimensions(
+                width, height, max_w, max_h, settings.allow_upscaling
             )
 
-            if (new_w, new_h) != (original_width, original_height):
-                logger.log(
-                    f"Fit to dimensions: {original_width}×{original_height} → {new_w}×{new_h}",
-                    LogLevel.INFO,
-                    "Converter"
-                )
-                return img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-            else:
-                logger.log(
-                    "Fit to dimensions: Image already within constraints",
-                    LogLevel.DEBUG,
-                    "Converter"
-                )
-                return img
+        return width, height
 
-        return img
+    @staticmethod
+    def _draft_jpeg(img: Image.Image, target_size: Tuple[int, int], transposed: bool) -> None:
+        """
+        Let libjpeg decode at 1/2, 1/4 or 1/8 scale when the output is much smaller.
+
+        Must be called before the image is loaded. The request keeps at least
+        2× the target size, so the LANCZOS pass afterwards still downsamples.
+
+        Args:
+            img: Freshly opened JPEG image
+            target_size: Final (width, height), in EXIF-oriented coordinates
+            transposed: Whether EXIF orientation swaps width and height
+        """
+        request_w, request_h = max(1, target_size[0] * 2), max(1, target_size[1] * 2)
+        if transposed:
+            request_w, request_h = request_h, request_w
+
+        if request_w < img.width and request_h < img.height:
+            img.draft(img.mode, (request_w, request_h))
 
     @staticmethod
     def _prepare_for_format(img: Image.Image, settings: ConversionSettings) -> Image.Image:
@@ -195,10 +431,23 @@ class ImageConverter:
         # JPEG: Convert RGBA/LA/P to RGB (JPEG doesn't support transparency)
         if settings.output_format == ImageFormat.JPEG and img.mode in ('RGBA', 'LA', 'P'):
             logger.log(f"Converting {img.mode} → RGB for JPEG format", LogLevel.DEBUG, "Converter")
+
+            # Fully opaque input: a plain convert skips the white canvas and paste
+            if img.mode == 'P':
+                opaque = 'transparency' not in img.info
+            else:
+                opaque = img.getchannel('A').getextrema()[0] == 255
+
+            if opaque:
+                logger.log("Alpha is fully opaque, converted directly to RGB", LogLevel.DEBUG, "Converter")
+                return img.convert('RGB')
+
             rgb_img = Image.new('RGB', img.size, (255, 255, 255))
             if img.mode == 'P':
                 img = img.convert('RGBA')
-            rgb_img.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+            # An RGBA/LA image passed as its own mask is read through its alpha band in place,
+            # so no separate alpha plane is allocated
+            rgb_img.paste(img, mask=img)
             logger.log("Converted to RGB for JPEG (white background applied)", LogLevel.INFO, "Converter")
             return rgb_img
 
@@ -210,12 +459,7 @@ class ImageConverter:
             if img.mode != 'P':
                 logger.log(f"Converting {img.mode} → P (palette) for GIF format", LogLevel.DEBUG, "Converter")
 
-                # Convert to palette mode with adaptive palette
-                # Apply dithering based on settings
-                if settings.gif_dithering == "floyd":
-                    img = img.convert('P', palette=Image.ADAPTIVE, colors=256)
-                else:  # "none"
-                    img = img.convert('P', palette=Image.ADAPTIVE, colors=256, dither=Image.NONE)
+                img = ImageConverter.to_gif_palette(img, settings.gif_dithering)
 
                 logger.log(
                     f"Converted to palette mode for GIF (256 colors, dithering={settings.gif_dithering})",
@@ -244,23 +488,25 @@ class ImageConverter:
                     # Pad with transparency to make square
                     logger.log("ICO: Using PAD method", LogLevel.INFO, "Converter")
 
-                    # Ensure RGBA mode for transparency
-                    if img.mode != 'RGBA':
+                    # Palette/bilevel images can't be LANCZOS-resampled, so they are
+                    # expanded first; other modes are resized as they are and become
+                    # RGBA when the small result is pasted onto the transparent canvas
+                    if img.mode in ('P', 'PA', '1'):
                         img = img.convert('RGBA')
 
-                    # Find the largest dimension
-                    max_dim = max(img.width, img.height)
-
-                    # Create new square image with transparent background
-                    new_img = Image.new('RGBA', (max_dim, max_dim), (0, 0, 0, 0))
-
-                    # Calculate position to center-paste original image
-                    paste_x = (max_dim - img.width) // 2
-                    paste_y = (max_dim - img.height) // 2
+                    # Scale the longer side to the target ICO size first, so LANCZOS
+                    # runs on the image itself rather than a full-size padded canvas
+                    scale = target_size / max(img.width, img.height)
+                    scaled_w = max(1, round(img.width * scale))
+                    scaled_h = max(1, round(img.height * scale))
+                    img = img.resize((scaled_w, scaled_h), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+
+                    # Center-paste onto a transparent target-size square
+                    new_img = Image.new('RGBA', (target_size, target_size), (0, 0, 0, 0))
+                    paste_x = (target_size - scaled_w) // 2
+                    paste_y = (target_size - scaled_h) // 2
                     new_img.paste(img, (paste_x, paste_y))
-
-                    # Resize to target ICO size
-                    img = new_img.resize((target_size, target_size), Image.Resampling.LANCZOS)
+                    img = new_img
 
                     logger.log(
                         f"ICO: Padded and resized to {target_size}×{target_size}",
@@ -285,7 +531,7 @@ class ImageConverter:
                     img = img.crop((left, top, right, bottom))
 
                     # Resize to target ICO size
-                    img = img.resize((target_size, target_size), Image.Resampling.LANCZOS)
+                    img = img.resize((target_size, target_size), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
 
                     logger.log(
                         f"ICO: Cropped and resized to {target_size}×{target_size}",
@@ -297,7 +543,7 @@ class ImageConverter:
                 # Already square - just resize to target size
                 logger.log("ICO: Image already square", LogLevel.INFO, "Converter")
                 if img.width != target_size:
-                    img = img.resize((target_size, target_size), Image.Resampling.LANCZOS)
+                    img = img.resize((target_size, target_size), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
                     logger.log(f"ICO: Resized to {target_size}×{target_size}", LogLevel.INFO, "Converter")
 
             # Ensure RGBA mode (32-bit ICO)
@@ -335,6 +581,30 @@ class ImageConverter:
         return img
 
     @staticmethod
+    def to_gif_palette(img: Image.Image, dithering: str) -> Image.Image:
+        """
+        Reduce an image to a 256-color adaptive palette for GIF output.
+
+        Uses libimagequant when this Pillow build includes it (faster, and
+        usually smaller GIFs than the built-in median cut).
+
+        Args:
+            img: Image in any mode other than 'P'
+            dithering: "floyd" (Floyd-Steinberg) or "none"
+
+        Returns:
+            Palette ('P') image
+        """
+        dither = Image.Dither.FLOYDSTEINBERG if dithering == "floyd" else Image.Dither.NONE
+
+        if _HAVE_LIBIMAGEQUANT and img.mode in ('RGB', 'RGBA'):
+            return img.quantize(colors=256, method=Image.Quantize.LIBIMAGEQUANT, dither=dither)
+
+        # Convert to palette mode with adaptive palette
+        return img.convert('P', palette=Image.Palette.ADAPTIVE, colors=256, dither=dither)
+
+    @staticmethod
+    @lru_cache(maxsize=256)  # Batches repeat the same source/box sizes
     def _calculate_fit_dimensions(
             orig_w: int,
             orig_h: int,
@@ -357,24 +627,26 @@ class ImageConverter:
         """
         aspect_ratio = orig_w / orig_h
 
+        # A side that already matches keeps the other side exact too, instead of
+        # letting float truncation shave off a pixel and force a LANCZOS pass.
         # If only one dimension specified
         if max_w and not max_h:
             new_w = max_w
-            new_h = int(max_w / aspect_ratio)
+            new_h = orig_h if max_w == orig_w else int(max_w / aspect_ratio)
         elif max_h and not max_w:
             new_h = max_h
-            new_w = int(max_h * aspect_ratio)
+            new_w = orig_w if max_h == orig_h else int(max_h * aspect_ratio)
         else:
             # Both dimensions specified - fit within box
             # Determine which dimension is the limiting factor
             if orig_w / max_w > orig_h / max_h:
                 # Width is the limiting factor
                 new_w = max_w
-                new_h = int(max_w / aspect_ratio)
+                new_h = orig_h if max_w == orig_w else int(max_w / aspect_ratio)
             else:
                 # Height is the limiting factor
                 new_h = max_h
-                new_w = int(max_h * aspect_ratio)
+                new_w = orig_w if max_h == orig_h else int(max_h * aspect_ratio)
 
         # Don't upscale unless explicitly allowed
         if not allow_upscale:
@@ -391,27 +663,86 @@ class ImageConverter:
             max_iterations: int = 20
     ) -> Tuple[bool, str, Optional[int]]:
         """
-        Compress image to target file size using improved binary search.
+        Compress image to target file size and write the result to output_path.
+
+        See _encode_to_target_size for the search itself.
+        """
+        buffer, size, message = ImageConverter._encode_to_target_size(img, settings, max_iterations)
+
+        # The single write for this search
+        ImageConverter._atomic_write(output_path, buffer)
+        return (True, message, size)
+
+    @staticmethod
+    def _encode_to_target_size(
+            img: Image.Image,
+            settings: ConversionSettings,
+            max_iterations: int = 20
+    ) -> Tuple[io.BytesIO, int, str]:
+        """
+        Encode image as close to the target file size as possible, in memory.
 
         Strategy:
         1. Test at minimum acceptable quality (15) to see if target is possible
+           (with a spare core, the first search probe runs alongside)
         2. If not possible, suggest resize
-        3. Otherwise, binary search for optimal quality
+        3. Otherwise, search for optimal quality. The first probe is halfway
+           to the quality setting; when that is under the target, the setting
+           itself is tried next. Once the target is bracketed
+           by two measured encodes, the next quality is interpolated in
+           log-size space (file size is roughly log-linear in quality), which
+           usually lands within tolerance in 2-3 encodes instead of ~6.
+        4. For large WebP/AVIF images, when no core was spare for the halfway
+           probe, the first search probe is instead predicted from two encodes
+           of a half-size proxy, which cost ~4× less each; full-size encodes
+           then only confirm or refine it.
+
+        Returns:
+            (buffer holding the chosen encode, its size in bytes, result message)
         """
         target_bytes = int(settings.target_size_kb * 1024)
         tolerance = max(0.02, 5120 / target_bytes)  # 2% or 5KB, whichever is larger
 
         min_quality = 15  # Don't go below this - quality becomes trash
         max_quality = 95  # Start at 95, quality 95-100 has minimal visual difference
+        small_bracket = 4  # Bracket width at or below which predicted-futile encodes are skipped
+        proxy_min_pixels = 4_000_000  # Below this a full-size encode is cheap enough
 
         logger.log(f"Target size: {settings.target_size_kb}KB (tolerance: {tolerance * 100:.1f}%)",
                    LogLevel.INFO, "Converter")
 
-        # Step 1: Check if target is achievable at minimum quality
-        buffer = io.BytesIO()
+        # WebP/AVIF encoders convert other modes to RGB(A) inside every save();
+        # convert once here so the repeated encodes below skip that pass
+        if settings.output_format in (ImageFormat.WEBP, ImageFormat.AVIF) and img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGBA' if img.has_transparency_data else 'RGB')
+
+        # Build save kwargs once; only 'quality' changes between attempts
         kwargs = settings.to_pillow_kwargs(quality_override=min_quality)
-        img.save(buffer, **kwargs)
-        min_size = len(buffer.getvalue())
+
+        if not settings.quality_override_applies:
+            # Lossless WebP/AVIF: quality has no effect, every encode is identical
+            buffer = io.BytesIO()
+            img.save(buffer, **kwargs)
+            size = buffer.getbuffer().nbytes  # Zero-copy size (no bytes copy)
+            return (buffer, size, f"Lossless output ({size / 1024:.1f}KB), target size not applied")
+
+        # Step 1: Check if target is achievable at minimum quality. It is the
+        # cheapest encode and settles feasibility on its own, so a target that
+        # can't be reached costs this single encode. With a spare core the
+        # first search probe (halfway to the quality setting) runs alongside.
+        setting_quality = max(min_quality + 2, min(max_quality, settings.quality))
+        mid_quality = (min_quality + setting_quality) >> 1
+        opening_qualities = [min_quality]
+        if _spare_cores() > 0:
+            opening_qualities.append(mid_quality)
+        opening = ImageConverter._encode_qualities(img, kwargs, opening_qualities, io.BytesIO())
+
+        # Every measured (quality -> size) pair, used to model the size curve
+        sizes = {probe_quality: probe_buffer.getbuffer().nbytes for probe_quality, probe_buffer in opening}
+
+        # Closest encode so far (the search loop compares the other opening probe)
+        best_quality, best_buffer = opening[0]
+        best_size = min_size = sizes[min_quality]
 
         logger.log(f"Size at quality {min_quality}: {min_size / 1024:.1f}KB", LogLevel.DEBUG, "Converter")
 
@@ -425,73 +756,109 @@ class ImageConverter:
                 "Converter"
             )
             # Save at minimum quality anyway
-            with open(output_path, 'wb') as f:
-                f.write(buffer.getvalue())
             return (
-                True,
-                f"⚠ Target not achievable. Saved at quality {min_quality} ({min_size / 1024:.1f}KB). Try resizing.",
-                min_size
+                best_buffer,
+                min_size,
+                f"⚠ Target not achievable. Saved at quality {min_quality} ({min_size / 1024:.1f}KB). Try resizing."
             )
 
-        # Step 2: Binary search for optimal quality
-        best_quality = (min_quality + max_quality) // 2
-        best_buffer = None
-        best_size = min_size
+        # Step 2: Search for optimal quality
+        # Between iterations the best encode and one scratch buffer stay alive;
+        # the scratch buffer is rewritten in place by the next iteration
+        spare_buffer = io.BytesIO()
+        target_achieved = False
 
         for iteration in range(max_iterations):
-            buffer = io.BytesIO()
-            kwargs = settings.to_pillow_kwargs(quality_override=best_quality)
-            img.save(buffer, **kwargs)
-            current_size = len(buffer.getvalue())
+            if iteration == 0:
+                results = opening  # Already encoded in step 1
+            else:
+                results = ImageConverter._encode_qualities(img, kwargs, [quality], spare_buffer)
 
-            logger.log(
-                f"Iteration {iteration + 1}: quality={best_quality}, size={current_size / 1024:.1f}KB",
-                LogLevel.DEBUG,
-                "Converter"
-            )
+            for quality, buffer in results:
+                current_size = buffer.getbuffer().nbytes
+                sizes[quality] = current_size
 
-            # Check if within tolerance
-            size_ratio = current_size / target_bytes
-            if (1 - tolerance) <= size_ratio <= (1 + tolerance):
-                # Perfect! Within tolerance
-                with open(output_path, 'wb') as f:
-                    f.write(buffer.getvalue())
                 logger.log(
-                    f"✓ Target achieved at quality {best_quality}",
-                    LogLevel.SUCCESS,
+                    f"Iteration {iteration + 1}: quality={quality}, size={current_size / 1024:.1f}KB",
+                    LogLevel.DEBUG,
                     "Converter"
                 )
-                return (
-                    True,
-                    f"✓ Target size achieved (quality {best_quality}, {current_size / 1024:.1f}KB)",
-                    current_size
-                )
-
-            # Track best attempt (closest to target without exceeding much)
-            if best_buffer is None or abs(current_size - target_bytes) < abs(best_size - target_bytes):
-                best_buffer = buffer.getvalue()
-                best_size = current_size
 
-            # Binary search adjustment
-            if current_size > target_bytes:
-                # Too large, reduce quality
-                max_quality = best_quality
-            else:
-                # Too small, increase quality
-                min_quality = best_quality
+                # Track best attempt (closest to target) so it never needs re-encoding
+                if abs(current_size - target_bytes) < abs(best_size - target_bytes):
+                    # Swap roles: the old best becomes the next scratch buffer
+                    best_buffer, spare_buffer = buffer, best_buffer
+                    best_size = current_size
+                    best_quality = quality
+
+                # Check if within tolerance
+                size_ratio = current_size / target_bytes
+                if (1 - tolerance) <= size_ratio <= (1 + tolerance):
+                    # Perfect! Within tolerance (closer than any encode outside it)
+                    target_achieved = True
+                elif current_size > target_bytes:
+                    # Too large, reduce quality
+                    max_quality = min(max_quality, quality)
+                else:
+                    # Too small, increase quality
+                    min_quality = max(min_quality, quality)
 
-            new_quality = (min_quality + max_quality) // 2
+            if target_achieved:
+                break
 
             # Check for convergence
-            if new_quality == best_quality or max_quality - min_quality <= 1:
+            if max_quality - min_quality <= 1:
                 break
 
-            best_quality = new_quality
+            if iteration == 0 and mid_quality not in sizes:
+                # First search probe: halfway to the quality setting. For large
+                # WebP/AVIF images two ~4× cheaper encodes on a half-size proxy
+                # pick it instead, in place of the halfway and quality-setting
+                # probes. JPEG encodes are too cheap for the extra reduce() pass
+                # and calibration encode to pay off.
+                if (settings.output_format in (ImageFormat.WEBP, ImageFormat.AVIF)
+                        and img.width * img.height >= proxy_min_pixels):
+                    quality = ImageConverter._proxy_quality(
+                        img, kwargs, min_quality, sizes[min_quality], min_quality, max_quality, target_bytes,
+                        tolerance
+                    )
+                else:
+                    quality = mid_quality
+            elif (mid_quality in sizes and setting_quality not in sizes and sizes[mid_quality] < target_bytes
+                  and min_quality < setting_quality < max_quality):
+                # Generous target: the quality setting itself may already meet it
+                quality = setting_quality
+            else:
+                quality = ImageConverter._next_quality(min_quality, max_quality, sizes, target_bytes)
+
+            # Tiny, fully measured bracket: a few qualities apart the size curve
+            # is close to log-linear, so only spend another encode if it is
+            # expected to land within tolerance
+            if max_quality - min_quality <= small_bracket and min_quality in sizes and max_quality in sizes:
+                log_low = math.log(sizes[min_quality])
+                log_high = math.log(sizes[max_quality])
+                fraction = (quality - min_quality) / (max_quality - min_quality)
+                predicted_ratio = math.exp(log_low + fraction * (log_high - log_low)) / target_bytes
+                if not (1 - tolerance) <= predicted_ratio <= (1 + tolerance):
+                    logger.log(
+                        f"No quality in {min_quality}-{max_quality} expected within tolerance, stopping",
+                        LogLevel.DEBUG,
+                        "Converter"
+                    )
+                    break
 
-        # Save best attempt
-        if best_buffer:
-            with open(output_path, 'wb') as f:
-                f.write(best_buffer)
+        # Best attempt is already encoded - no re-encode needed
+        if target_achieved:
+            logger.log(
+                f"✓ Target achieved at quality {best_quality}",
+                LogLevel.SUCCESS,
+                "Converter"
+            )
+            return (
+                best_buffer,
+                best_size,
+                f"✓ Target size achieved (quality {best_quality}, {best_size / 1024:.1f}KB)"
+            )
 
         logger.log(
             f"Closest match: quality {best_quality}, size {best_size / 1024:.1f}KB",
@@ -500,11 +867,227 @@ class ImageConverter:
         )
 
         return (
-            True,
-            f"Closest match at quality {best_quality} ({best_size / 1024:.1f}KB)",
-            best_size
+            best_buffer,
+            best_size,
+            f"Closest match at quality {best_quality} ({best_size / 1024:.1f}KB)"
         )
 
+    @staticmethod
+    def _encode_qualities(
+            img: Image.Image,
+            kwargs: Dict,
+            qualities: List[int],
+            buffer: io.BytesIO
+    ) -> List[Tuple[int, io.BytesIO]]:
+        """
+        Encode img at one or more qualities, concurrently when cores are spare.
+
+        Pillow releases the GIL while encoding, so extra encodes can run on
+        worker threads. That only happens when _spare_cores() leaves a core for
+        each of them; inside a busy batch the encodes run one after another.
+        Threads save through their own Image object sharing img's pixels,
+        because save() stores per-call encoder state on the Image object.
+
+        Args:
+            img: Prepared image
+            kwargs: Save kwargs (not modified)
+            qualities: Qualities to encode
+            buffer: Scratch buffer reused for the first quality
+
+        Returns:
+            [(quality, buffer holding that encode)] in the order of qualities
+        """
+        buffer.seek(0)
+        buffer.truncate()
+        buffers = [buffer] + [io.BytesIO() for _ in qualities[1:]]
+
+        if len(qualities) == 1 or _spare_cores() < len(qualities) - 1:
+            for quality, target in zip(qualities, buffers):
+                img.save(target, **{**kwargs, 'quality': quality})
+        else:
+            img.load()
+            with ThreadPoolExecutor(max_workers=len(qualities) - 1) as pool:
+                futures = [
+                    # _new() wraps the same pixel core (no pixel copy) in a separate Image
+                    pool.submit(img._new(img.im).save, extra, **{**kwargs, 'quality': quality})
+                    for quality, extra in zip(qualities[1:], buffers[1:])
+                ]
+                img.save(buffer, **{**kwargs, 'quality': qualities[0]})
+                for future in futures:
+                    future.result()
+
+        return list(zip(qualities, buffers))
+
+    @staticmethod
+    def _proxy_quality(
+            img: Image.Image,
+            kwargs: Dict,
+            probe_quality: int,
+            probe_size: int,
+            low_quality: int,
+            high_quality: int,
+            target_bytes: int,
+            tolerance: float,
+            max_iterations: int = 1
+    ) -> int:
+        """
+        Estimate the quality that hits target_bytes using a half-size proxy.
+
+        Encoded size scales with pixel count at a fairly constant ratio, so the
+        full-size probe at probe_quality and a proxy encode at the same quality
+        calibrate the target; the search then runs on the proxy only. With the
+        default single step it costs two proxy encodes, about half of the
+        full-size probe it replaces, and returns the size model's prediction.
+
+        Args:
+            img: Full-size prepared image
+            kwargs: Save kwargs (not modified)
+            probe_quality: Quality of the last full-size encode
+            probe_size: Its size in bytes
+            low_quality: Highest full-size quality known to be under the target
+            high_quality: Lowest full-size quality known to be over it
+            target_bytes: Target file size of the full-size encode
+            tolerance: Relative size tolerance
+            max_iterations: Maximum proxy encodes after calibration
+
+        Returns:
+            Quality strictly between low_quality and high_quality
+        """
+        proxy = img.reduce(2)  # Box-filter 2× downscale, much cheaper than a resampling filter
+        proxy_kwargs = {**kwargs, 'quality': probe_quality}
+        buffer = io.BytesIO()
+        proxy.save(buffer, **proxy_kwargs)
+
+        proxy_target = target_bytes * buffer.getbuffer().nbytes / probe_size
+        sizes = {probe_quality: buffer.getbuffer().nbytes}
+        quality = best_quality = (low_quality + high_quality) >> 1
+        best_error = None
+
+        for _ in range(max_iterations):
+            buffer.seek(0)
+            buffer.truncate()
+            proxy_kwargs['quality'] = quality
+            proxy.save(buffer, **proxy_kwargs)
+            size = buffer.getbuffer().nbytes
+            sizes[quality] = size
+
+            error = abs(size - proxy_target)
+            if best_error is None or error < best_error:
+                best_quality, best_error = quality, error
+
+            if error <= proxy_target * tolerance:
+                break
+            if size > proxy_target:
+                high_quality = quality
+            else:
+                low_quality = quality
+            if high_quality - low_quality <= 1:
+                break
+            quality = ImageConverter._next_quality(low_quality, high_quality, sizes, proxy_target)
+        else:
+            # Out of steps: the size model's next pick is a better estimate
+            # than the closest quality measured so far
+            best_quality = quality
+
+        logger.log(f"Proxy search suggests quality {best_quality}", LogLevel.DEBUG, "Converter")
+        return best_quality
+
+    @staticmethod
+    def _next_quality(
+            low_quality: int,
+            high_quality: int,
+            sizes: Dict[int, int],
+            target_bytes: int
+    ) -> int:
+        """
+        Pick the next quality to try inside the (low, high) bracket.
+
+        File size is modelled as log(size) = a + b * quality:
+        - Both bracket ends measured: interpolate between them (local model)
+        - Otherwise: least-squares fit over every measured sample, so the
+          search can extrapolate towards an unmeasured upper end
+        - Midpoint when there are too few samples or the fit is degenerate
+
+        Args:
+            low_quality: Highest quality known to be under the target
+            high_quality: Lowest quality known (or assumed) to be over it
+            sizes: Measured {quality: size_bytes} samples
+            target_bytes: Target file size
+
+        Returns:
+            Quality strictly between low_quality and high_quality
+        """
+        low_size = sizes.get(low_quality)
+        high_size = sizes.get(high_quality)
+
+        if low_size and high_size and high_size > low_size:
+            log_low = math.log(low_size)
+            slope = (math.log(high_size) - log_low) / (high_quality - low_quality)
+            intercept = log_low - slope * low_quality
+        elif len(sizes) >= 2:
+            qualities = list(sizes)
+            logs = [math.log(max(size, 1)) for size in sizes.values()]
+            mean_q = sum(qualities) / len(qualities)
+            mean_log = sum(logs) / len(logs)
+            spread = sum((q - mean_q) ** 2 for q in qualities)
+            slope = sum((q - mean_q) * (l - mean_log) for q, l in zip(qualities, logs)) / spread
+            intercept = mean_log - slope * mean_q
+        else:
+            slope = 0.0
+
+        if slope <= 0:
+            return (low_quality + high_quality) >> 1
+
+        quality = round((math.log(target_bytes) - intercept) / slope)
+        return max(low_quality + 1, min(high_quality - 1, quality))
+
+    @staticmethod
+    def _save_and_size(img: Image.Image, output_path: Path, **save_kwargs) -> int:
+        """
+        Save an image and return the written size.
+
+        The size comes from fstat on the still-open file descriptor instead
+        of a separate stat() of the path after closing it.
+
+        Returns:
+            Output file size in bytes
+        """
+        try:
+            with open(output_path, 'wb') as f:
+                img.save(f, **save_kwargs)
+                f.flush()
+                return os.fstat(f.fileno()).st_size
+        except BaseException:
+            # Match Image.save(path): don't leave a partial file behind
+            output_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _atomic_write(output_path: Path, buffer: io.BytesIO) -> None:
+        """
+        Write an encoded BytesIO to disk atomically.
+
+        The data goes to a sibling temp file that replaces output_path only
+        once fully written, so an aborted write never leaves a truncated
+        output. The buffer is handed to os.write() as a memoryview, with no
+        bytes copy or Python-level buffering, normally in a single syscall.
+        """
+        temp_path = output_path.with_suffix(output_path.suffix + '.tmp')
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        try:
+            fd = os.open(temp_path, flags, 0o644)
+            try:
+                with buffer.getbuffer() as view:
+                    written = 0
+                    while written < view.nbytes:  # os.write may write partially
+                        written += os.write(fd, view[written:])
+            finally:
+                os.close(fd)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
     @staticmethod
     def calculate_savings(original_size: int, converted_size: int) -> Tuple[float, str]:
         """Calculate size reduction percentage."""
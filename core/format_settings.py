@@ -57,21 +57,48 @@ class FilenameTemplate(Enum):
         if not enable_suffix:
             return original_stem
 
-        if self == FilenameTemplate.CONVERTED:
-            return f"{original_stem}_converted"
-        elif self == FilenameTemplate.FORMAT:
-            return f"{original_stem}_{format_name}"
-        elif self == FilenameTemplate.QUALITY:
-            return f"{original_stem}_Q{quality}"
-        elif self == FilenameTemplate.CUSTOM:
-            # Apply custom suffix if provided, otherwise no suffix
-            if custom_suffix:
-                # Ensure suffix starts with underscore if not empty
-                if not custom_suffix.startswith("_"):
-                    custom_suffix = f"_{custom_suffix}"
-                return f"{original_stem}{custom_suffix}"
-            return original_stem
-        return original_stem
+        return _TEMPLATE_APPLIERS[self](original_stem, format_name, quality, custom_suffix)
+
+
+def _apply_custom_suffix(original_stem: str, format_name: str, quality: int, custom_suffix: str) -> str:
+    # Apply custom suffix if provided, otherwise no suffix
+    if custom_suffix:
+        # Ensure suffix starts with underscore if not empty
+        if not custom_suffix.startswith("_"):
+            custom_suffix = f"_{custom_suffix}"
+        return f"{original_stem}{custom_suffix}"
+    return original_stem
+
+
+# Template -> stem builder(original_stem, format_name, quality, custom_suffix), chosen by lookup
+_TEMPLATE_APPLIERS = {
+    FilenameTemplate.CONVERTED: lambda stem, fmt, quality, custom: f"{stem}_converted",
+    FilenameTemplate.FORMAT: lambda stem, fmt, quality, custom: f"{stem}_{fmt}",
+    FilenameTemplate.QUALITY: lambda stem, fmt, quality, custom: f"{stem}_Q{quality}",
+    FilenameTemplate.CUSTOM: _apply_custom_suffix,
+}
+
+
+# TIFF compression setting -> Pillow 'compression' value (None = uncompressed)
+_TIFF_COMPRESSION = {
+    'none': None,
+    'lzw': 'tiff_lzw',
+    'jpeg': 'jpeg',
+    'packbits': 'packbits'
+}
+
+
+# Output format -> file extension
+_FILE_EXTENSIONS = {
+    ImageFormat.WEBP: '.webp',
+    ImageFormat.AVIF: '.avif',
+    ImageFormat.JPEG: '.jpg',
+    ImageFormat.PNG: '.png',
+    ImageFormat.TIFF: '.tiff',
+    ImageFormat.GIF: '.gif',
+    ImageFormat.BMP: '.bmp',
+    ImageFormat.ICO: '.ico'
+}
 
 
 @dataclass
@@ -133,83 +160,78 @@ class ConversionSettings:
         Args:
             quality_override: Override quality for target size iterations
         """
-        kwargs = {}
         actual_quality = quality_override if quality_override is not None else self.quality
-
-        if self.output_format == ImageFormat.WEBP:
-            kwargs['format'] = 'WEBP'
-            if self.lossless:
-                kwargs['lossless'] = True
-            else:
-                kwargs['quality'] = actual_quality
-            kwargs['method'] = self.webp_method
-
-        elif self.output_format == ImageFormat.AVIF:
-            kwargs['format'] = 'AVIF'
-            if self.lossless:
-                kwargs['quality'] = 100
-            else:
-                kwargs['quality'] = actual_quality
-            kwargs['speed'] = self.avif_speed
-            kwargs['range'] = self.avif_range
-
-        elif self.output_format == ImageFormat.JPEG:
-            kwargs['format'] = 'JPEG'
-            kwargs['quality'] = actual_quality
-            kwargs['optimize'] = True
-
-        elif self.output_format == ImageFormat.PNG:
-            kwargs['format'] = 'PNG'
-            kwargs['optimize'] = True
-            kwargs['compress_level'] = self.png_compress_level
-
-        elif self.output_format == ImageFormat.TIFF:
-            kwargs['format'] = 'TIFF'
-            # Map compression names to PIL-expected values
-            compression_map = {
-                'none': None,
-                'lzw': 'tiff_lzw',
-                'jpeg': 'jpeg',
-                'packbits': 'packbits'
-            }
-            if self.tiff_compression in compression_map:
-                compression_value = compression_map[self.tiff_compression]
-                if compression_value is not None:  # Only add if not 'none'
-                    kwargs['compression'] = compression_value
-            # Only add quality if JPEG compression is used
-            if self.tiff_compression == 'jpeg':
-                kwargs['quality'] = self.tiff_jpeg_quality
-
-        elif self.output_format == ImageFormat.GIF:
-            kwargs['format'] = 'GIF'
-            kwargs['optimize'] = self.gif_optimize
-            # Dithering handled during palette conversion in converter
-
-        elif self.output_format == ImageFormat.ICO:
-            kwargs['format'] = 'ICO'
-            # Size specification handled in converter (image needs to be square first)
-            kwargs['sizes'] = [(self.ico_size, self.ico_size)]
-
-        elif self.output_format == ImageFormat.BMP:
-            kwargs['format'] = 'BMP'
-            # No options for BMP (uncompressed)
+        kwargs = self._KWARG_BUILDERS[self.output_format](self, actual_quality)
 
         if not self.keep_metadata:
             kwargs['exif'] = b''
 
         return kwargs
 
+    # ==========================================
+    # Per-format save() kwargs builders
+    # ==========================================
+
+    def _webp_kwargs(self, quality: int) -> Dict[str, Any]:
+        if self.lossless:
+            return {'format': 'WEBP', 'lossless': True, 'method': self.webp_method}
+        return {'format': 'WEBP', 'quality': quality, 'method': self.webp_method}
+
+    def _avif_kwargs(self, quality: int) -> Dict[str, Any]:
+        return {
+            'format': 'AVIF',
+            'quality': 100 if self.lossless else quality,
+            'speed': self.avif_speed,
+            'range': self.avif_range,
+        }
+
+    def _jpeg_kwargs(self, quality: int) -> Dict[str, Any]:
+        return {'format': 'JPEG', 'quality': quality, 'optimize': True}
+
+    def _png_kwargs(self, quality: int) -> Dict[str, Any]:
+        return {'format': 'PNG', 'optimize': True, 'compress_level': self.png_compress_level}
+
+    def _tiff_kwargs(self, quality: int) -> Dict[str, Any]:
+        kwargs = {'format': 'TIFF'}
+        compression = _TIFF_COMPRESSION.get(self.tiff_compression)
+        if compression is not None:  # Only add if not 'none'
+            kwargs['compression'] = compression
+        # Only add quality if JPEG compression is used
+        if self.tiff_compression == 'jpeg':
+            kwargs['quality'] = self.tiff_jpeg_quality
+        return kwargs
+
+    def _gif_kwargs(self, quality: int) -> Dict[str, Any]:
+        # Dithering handled during palette conversion in converter
+        return {'format': 'GIF', 'optimize': self.gif_optimize}
+
+    def _ico_kwargs(self, quality: int) -> Dict[str, Any]:
+        # Size specification handled in converter (image needs to be square first)
+        return {'format': 'ICO', 'sizes': [(self.ico_size, self.ico_size)]}
+
+    def _bmp_kwargs(self, quality: int) -> Dict[str, Any]:
+        return {'format': 'BMP'}  # No options for BMP (uncompressed)
+
+    # Output format -> kwargs builder (a plain class attribute, not a dataclass field)
+    _KWARG_BUILDERS = {
+        ImageFormat.WEBP: _webp_kwargs,
+        ImageFormat.AVIF: _avif_kwargs,
+        ImageFormat.JPEG: _jpeg_kwargs,
+        ImageFormat.PNG: _png_kwargs,
+        ImageFormat.TIFF: _tiff_kwargs,
+        ImageFormat.GIF: _gif_kwargs,
+        ImageFormat.ICO: _ico_kwargs,
+        ImageFormat.BMP: _bmp_kwargs,
+    }
+
+    @property
+    def quality_override_applies(self) -> bool:
+        """Whether to_pillow_kwargs() puts quality_override into the 'quality' kwarg."""
+        if self.output_format == ImageFormat.JPEG:
+            return True
+        return self.output_format in (ImageFormat.WEBP, ImageFormat.AVIF) and not self.lossless
+
     @property
     def file_extension(self) -> str:
         """Get file extension for the format."""
-        extensions = {
-            ImageFormat.WEBP: '.webp',
-            ImageFormat.AVIF: '.avif',
-            ImageFormat.JPEG: '.jpg',
-            ImageFormat.PNG: '.png',
-            ImageFormat.TIFF: '.tiff',
-            ImageFormat.GIF: '.gif',
-            ImageFormat.BMP: '.bmp',
-            ImageFormat.ICO: '.ico'
-        }
-        return extensions[self.output_format]
+        return _FILE_EXTENSIONS[self.output_format]
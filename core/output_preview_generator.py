@@ -15,9 +15,15 @@ Settings Skipped (for preview purposes):
 - WebP/AVIF advanced options (subsampling, method, speed, range)
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from PIL import Image, ImageOps
-from typing import Optional
+from PIL import Image
+from typing import List, Optional, Sequence, Tuple
+import os
+import threading
+from core.converter import ImageConverter, REDUCING_GAP
 from core.format_settings import ConversionSettings, ResizeMode, ImageFormat
 from utils.logger import logger
 
@@ -30,6 +36,13 @@ class OutputPreviewGenerator:
     Returns a PIL Image object, NOT a file.
     """
 
+    # Recently prepared (decoded, oriented, resized, mode-converted) images.
+    # Quality, lossless and encoder options don't change this stage, so moving
+    # those sliders re-encodes the cached image instead of decoding again.
+    _PREPARED_CACHE_SIZE = 2
+    _prepared_cache: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+    _prepared_cache_lock = threading.Lock()
+
     @staticmethod
     def generate_preview(
             image_path: Path,
@@ -43,7 +56,8 @@ class OutputPreviewGenerator:
             settings: Conversion settings to apply
 
         Returns:
-            PIL Image with settings applied, or None if generation fails
+            PIL Image with settings applied, or None if generation fails.
+            The caller owns it; the prepared-image cache keeps its own copy.
 
         Note:
             - Does NOT save to disk
@@ -57,6 +71,20 @@ class OutputPreviewGenerator:
         )
 
         try:
+            cache_key = OutputPreviewGenerator._cache_key(image_path, settings)
+            with OutputPreviewGenerator._prepared_cache_lock:
+                cached = OutputPreviewGenerator._prepared_cache.get(cache_key)
+                if cached is not None:
+                    OutputPreviewGenerator._prepared_cache.move_to_end(cache_key)
+
+            if cached is not None:
+                logger.debug(
+                    f"Reusing prepared image for {image_path.name} (only encoder settings changed)",
+                    source="OutputPreviewGenerator"
+                )
+                # Copy so concurrent workers never save the same Image object
+                return cached.copy()
+
             # Load image with EXIF orientation fix
             with Image.open(image_path) as img:
                 original_size = img.size
@@ -65,16 +93,41 @@ class OutputPreviewGenerator:
                     source="OutputPreviewGenerator"
                 )
 
+                orientation = img.getexif().get(0x0112, 1)  # 0x0112 = Orientation
+                transposed = orientation in (5, 6, 7, 8)  # Rotated by 90° / 270°
+
+                # Output size comes from the full-size source (as displayed),
+                # before draft() can shrink img.size
+                oriented_size = original_size[::-1] if transposed else original_size
+                if settings.output_format == ImageFormat.ICO:
+                    # ICO preparation scales to ico_size itself; skip the
+                    # generic resize so there is only one LANCZOS pass
+                    target_size = None
+                    draft_size = (settings.ico_size, settings.ico_size)
+                else:
+                    target_size = OutputPreviewGenerator._target_size(*oriented_size, settings)
+                    draft_size = target_size
+
+                # JPEG: let libjpeg decode at 1/2, 1/4 or 1/8 scale while that
+                # still leaves at least 2× the target for the LANCZOS pass
+                if img.format == 'JPEG':
+                    request_w, request_h = max(1, draft_size[0] * 2), max(1, draft_size[1] * 2)
+                    if transposed:
+                        request_w, request_h = request_h, request_w
+                    if request_w < img.width and request_h < img.height:
+                        img.draft(img.mode, (request_w, request_h))
+
                 # Fix EXIF orientation (rotate/flip based on EXIF data)
-                img = ImageOps.exif_transpose(img)
-                if img.size != original_size:
+                if orientation != 1:
+                    img = ImageConverter.apply_exif_orientation(img, orientation)
                     logger.debug(
                         f"EXIF orientation applied: {img.size[0]}×{img.size[1]}",
                         source="OutputPreviewGenerator"
                     )
 
-                # Apply resize if needed (ONLY scale %, skip max dimensions)
-                img = OutputPreviewGenerator._apply_resize(img, settings)
+                # Apply resize if needed
+                if target_size is not None:
+                    img = OutputPreviewGenerator._apply_resize(img, settings, target_size)
 
                 # Apply format-specific operations (RGBA → RGB conversion, etc.)
                 img = OutputPreviewGenerator._prepare_for_format(img, settings)
@@ -85,8 +138,19 @@ class OutputPreviewGenerator:
                     source="OutputPreviewGenerator"
                 )
 
-                # Return a copy (PIL Image object in memory)
-                return img.copy()
+                # Resize and mode conversion already return new in-memory images;
+                # load() only matters when img is still the untouched source,
+                # whose pixels must be read before the file is closed
+                img.load()
+
+            with OutputPreviewGenerator._prepared_cache_lock:
+                cache = OutputPreviewGenerator._prepared_cache
+                cache[cache_key] = img
+                while len(cache) > OutputPreviewGenerator._PREPARED_CACHE_SIZE:
+                    cache.popitem(last=False)
+
+            # Like cache hits, hand out a copy so callers never hold the cached instance
+            return img.copy()
 
         except FileNotFoundError:
             logger.error(
@@ -101,74 +165,101 @@ class OutputPreviewGenerator:
             )
             return None
 
+    @classmethod
+    def clear_prepared_cache(cls) -> None:
+        """Drop all cached prepared images (frees their full-resolution pixels)."""
+        with cls._prepared_cache_lock:
+            cls._prepared_cache.clear()
+
     @staticmethod
-    def _apply_resize(img: Image.Image, settings: ConversionSettings) -> Image.Image:
+    def generate_previews(
+            image_paths: Sequence[Path],
+            settings: ConversionSettings,
+            max_workers: Optional[int] = None
+    ) -> List[Optional[Image.Image]]:
         """
-        Apply resize based on settings for output preview.
+        Generate previews for several files concurrently.
+
+        Decode, resize and mode conversion run in Pillow's C code with the GIL
+        released, so plain threads scale across cores here without the
+        start-up and pickling cost of worker processes.
+
+        Args:
+            image_paths: Source image files
+            settings: Conversion settings applied to every file
+            max_workers: Thread count (default: CPU count)
+
+        Returns:
+            generate_preview results, in the same order as image_paths
+        """
+        if len(image_paths) <= 1:
+            return [OutputPreviewGenerator.generate_preview(path, settings) for path in image_paths]
+
+        workers = min(max_workers or os.cpu_count() or 1, len(image_paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(OutputPreviewGenerator.generate_preview, image_paths, repeat(settings)))
+
+    @staticmethod
+    def _cache_key(image_path: Path, settings: ConversionSettings) -> tuple:
+        """
+        Key for the prepared-image cache: the source file's identity plus every
+        setting that generate_preview uses before encoding.
+        """
+        stat = image_path.stat()
+        return (
+            str(image_path), stat.st_mtime_ns, stat.st_size,
+            settings.output_format, settings.resize_mode, settings.resize_percentage,
+            settings.target_width_px, settings.target_height_px,
+            settings.max_width_px, settings.max_height_px, settings.allow_upscaling,
+            settings.gif_dithering, settings.ico_size, settings.ico_force_square,
+            settings.tiff_compression,
+        )
+
+    @staticmethod
+    def _target_size(width: int, height: int, settings: ConversionSettings) -> Tuple[int, int]:
         """
+        Calculate the output preview size for a width × height source.
 
+        Returns:
+            (new_width, new_height), or (width, height) when no resize applies
+        """
         if settings.resize_mode == ResizeMode.NONE:
             logger.debug("No resize applied (ResizeMode.NONE)", source="OutputPreviewGenerator")
-            return img
+            return width, height
 
-        original_width, original_height = img.size
+        aspect_ratio = width / height
 
         if settings.resize_mode == ResizeMode.PERCENTAGE:
             scale = settings.resize_percentage / 100.0
-            new_width = int(original_width * scale)
-            new_height = int(original_height * scale)
-
-            if (new_width, new_height) != (original_width, original_height):
-                logger.debug(
-                    f"Percentage: {original_width}×{original_height} → {new_width}×{new_height}",
-                    source="OutputPreviewGenerator"
-                )
-                return img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            return img
+            return int(width * scale), int(height * scale)
 
         elif settings.resize_mode == ResizeMode.FIT_TO_WIDTH:
             if not settings.target_width_px:
                 logger.debug("Fit to width: No target specified", source="OutputPreviewGenerator")
-                return img
+                return width, height
 
             target_w = settings.target_width_px
-            aspect_ratio = original_width / original_height
-            new_w = target_w
-            new_h = int(target_w / aspect_ratio)
-
-            if not settings.allow_upscaling and new_w > original_width:
+            if target_w == width:
+                return width, height
+            if not settings.allow_upscaling and target_w > width:
                 logger.debug("Fit to width: Upscaling disabled", source="OutputPreviewGenerator")
-                return img
+                return width, height
 
-            if (new_w, new_h) != (original_width, original_height):
-                logger.debug(
-                    f"Fit to width: {original_width}×{original_height} → {new_w}×{new_h}",
-                    source="OutputPreviewGenerator"
-                )
-                return img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-            return img
+            return target_w, int(target_w / aspect_ratio)
 
         elif settings.resize_mode == ResizeMode.FIT_TO_HEIGHT:
             if not settings.target_height_px:
                 logger.debug("Fit to height: No target specified", source="OutputPreviewGenerator")
-                return img
+                return width, height
 
             target_h = settings.target_height_px
-            aspect_ratio = original_width / original_height
-            new_h = target_h
-            new_w = int(target_h * aspect_ratio)
-
-            if not settings.allow_upscaling and new_h > original_height:
+            if target_h == height:
+                return width, height
+            if not settings.allow_upscaling and target_h > height:
                 logger.debug("Fit to height: Upscaling disabled", source="OutputPreviewGenerator")
-                return img
+                return width, height
 
-            if (new_w, new_h) != (original_width, original_height):
-                logger.debug(
-                    f"Fit to height: {original_width}×{original_height} → {new_w}×{new_h}",
-                    source="OutputPreviewGenerator"
-                )
-                return img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-            return img
+            return int(target_h * aspect_ratio), target_h
 
         elif settings.resize_mode == ResizeMode.FIT_TO_DIMENSIONS:
             max_w = settings.max_width_px
@@ -176,38 +267,57 @@ class OutputPreviewGenerator:
 
             if not max_w and not max_h:
                 logger.debug("Fit to dimensions: No dimensions specified", source="OutputPreviewGenerator")
-                return img
+                return width, height
 
             # Calculate fit dimensions
-            aspect_ratio = original_width / original_height
-
             if max_w and not max_h:
                 new_w = max_w
-                new_h = int(max_w / aspect_ratio)
+                new_h = height if max_w == width else int(max_w / aspect_ratio)
             elif max_h and not max_w:
                 new_h = max_h
-                new_w = int(max_h * aspect_ratio)
+                new_w = width if max_h == height else int(max_h * aspect_ratio)
             else:
-                if original_width / max_w > original_height / max_h:
+                if width / max_w > height / max_h:
                     new_w = max_w
-                    new_h = int(max_w / aspect_ratio)
+                    new_h = height if max_w == width else int(max_w / aspect_ratio)
                 else:
                     new_h = max_h
-                    new_w = int(max_h * aspect_ratio)
+                    new_w = width if max_h == height else int(max_h * aspect_ratio)
 
             if not settings.allow_upscaling:
-                new_w = min(new_w, original_width)
-                new_h = min(new_h, original_height)
+                new_w = min(new_w, width)
+                new_h = min(new_h, height)
 
-            if (new_w, new_h) != (original_width, original_height):
-                logger.debug(
-                    f"Fit to dimensions: {original_width}×{original_height} → {new_w}×{new_h}",
-                    source="OutputPreviewGenerator"
-                )
-                return img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+            return new_w, new_h
+
+        return width, height
+
+    @staticmethod
+    def _apply_resize(
+            img: Image.Image,
+            settings: ConversionSettings,
+            target_size: Optional[Tuple[int, int]] = None
+    ) -> Image.Image:
+        """
+        Apply resize based on settings for output preview.
+
+        Args:
+            img: Image to resize
+            settings: Conversion settings with resize mode and targets
+            target_size: Precomputed size from _target_size. Needed when img
+                was drafted to a smaller size than the source.
+        """
+        if target_size is None:
+            target_size = OutputPreviewGenerator._target_size(img.width, img.height, settings)
+
+        if target_size == img.size:
             return img
 
-        return img
+        logger.debug(
+            f"Resize ({settings.resize_mode.value}): {img.width}×{img.height} → {target_size[0]}×{target_size[1]}",
+            source="OutputPreviewGenerator"
+        )
+        return img.resize(target_size, Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
 
     @staticmethod
     def _prepare_for_format(
@@ -230,6 +340,19 @@ class OutputPreviewGenerator:
                     source="OutputPreviewGenerator"
                 )
 
+                # Fully opaque input: a plain convert skips the white canvas and paste
+                if img.mode == 'P':
+                    opaque = 'transparency' not in img.info
+                else:
+                    opaque = img.getchannel('A').getextrema()[0] == 255
+
+                if opaque:
+                    logger.debug(
+                        "Alpha is fully opaque, converted directly to RGB",
+                        source="OutputPreviewGenerator"
+                    )
+                    return img.convert('RGB')
+
                 # Create white background
                 rgb_img = Image.new('RGB', img.size, (255, 255, 255))
 
@@ -237,11 +360,8 @@ class OutputPreviewGenerator:
                 if img.mode == 'P':
                     img = img.convert('RGBA')
 
-                # Paste with alpha mask
-                if img.mode in ('RGBA', 'LA'):
-                    rgb_img.paste(img, mask=img.split()[-1])  # Use alpha channel as mask
-                else:
-                    rgb_img.paste(img)
+                # Paste with alpha mask (the image's own alpha band, read in place)
+                rgb_img.paste(img, mask=img)
 
                 logger.info(
                     f"Converted to RGB for JPEG (white background applied)",
@@ -254,14 +374,14 @@ class OutputPreviewGenerator:
         elif settings.output_format in (ImageFormat.WEBP, ImageFormat.AVIF):
             if img.mode == 'RGBA':
                 # Check if image has actual transparency
-                if img.getextrema()[3][0] == 255:  # Alpha channel is all 255 (opaque)
+                if img.getchannel('A').getextrema()[0] == 255:  # Alpha channel is all 255 (opaque)
                     logger.debug(
                         "Converting RGBA → RGB (no transparency detected)",
                         source="OutputPreviewGenerator"
                     )
-                    rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                    rgb_img.paste(img)
-                    return rgb_img
+                    # Opaque alpha: dropping the band gives the same pixels as
+                    # compositing over white, without a canvas + paste pass
+                    return img.convert('RGB')
 
         # ==========================================
         # GIF format preparation
@@ -274,12 +394,8 @@ class OutputPreviewGenerator:
                     source="OutputPreviewGenerator"
                 )
 
-                # Convert to palette mode with adaptive palette
-                # Apply dithering based on settings
-                if settings.gif_dithering == "floyd":
-                    img = img.convert('P', palette=Image.ADAPTIVE, colors=256)
-                else:  # "none"
-                    img = img.convert('P', palette=Image.ADAPTIVE, colors=256, dither=Image.NONE)
+                # Same palette reduction as the real conversion
+                img = ImageConverter.to_gif_palette(img, settings.gif_dithering)
 
                 logger.info(
                     f"Converted to palette mode for GIF (256 colors, dithering={settings.gif_dithering})",
@@ -303,21 +419,24 @@ class OutputPreviewGenerator:
                         source="OutputPreviewGenerator"
                     )
 
-                    # Ensure RGBA mode for transparency
-                    if img.mode != 'RGBA':
+                    # Palette/bilevel images can't be LANCZOS-resampled, so they are
+                    # expanded first; other modes are resized as they are and become
+                    # RGBA when the small result is pasted onto the transparent canvas
+                    if img.mode in ('P', 'PA', '1'):
                         img = img.convert('RGBA')
 
-                    # Calculate padding
-                    max_dim = max(img.width, img.height)
-                    new_img = Image.new('RGBA', (max_dim, max_dim), (0, 0, 0, 0))
+                    # Resize first (longer side to target), then pad the small result
+                    scale = target_size / max(img.width, img.height)
+                    scaled_w = max(1, round(img.width * scale))
+                    scaled_h = max(1, round(img.height * scale))
+                    img = img.resize((scaled_w, scaled_h), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
 
-                    # Center paste
-                    paste_x = (max_dim - img.width) // 2
-                    paste_y = (max_dim - img.height) // 2
+                    # Center paste onto target-size square
+                    new_img = Image.new('RGBA', (target_size, target_size), (0, 0, 0, 0))
+                    paste_x = (target_size - scaled_w) // 2
+                    paste_y = (target_size - scaled_h) // 2
                     new_img.paste(img, (paste_x, paste_y))
-
-                    # Resize to target size
-                    img = new_img.resize((target_size, target_size), Image.Resampling.LANCZOS)
+                    img = new_img
 
                     logger.info(
                         f"ICO padded to square: {target_size}×{target_size}",
@@ -343,7 +462,7 @@ class OutputPreviewGenerator:
                     img = img.crop((left, top, right, bottom))
 
                     # Resize to target size
-                    img = img.resize((target_size, target_size), Image.Resampling.LANCZOS)
+                    img = img.resize((target_size, target_size), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
 
                     logger.info(
                         f"ICO cropped to square: {target_size}×{target_size}",
@@ -358,7 +477,9 @@ class OutputPreviewGenerator:
                         f"Resizing square ICO: {img.width}×{img.height} → {settings.ico_size}×{settings.ico_size}",
                         source="OutputPreviewGenerator"
                     )
-                    img = img.resize((settings.ico_size, settings.ico_size), Image.Resampling.LANCZOS)
+                    img = img.resize(
+                        (settings.ico_size, settings.ico_size), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP
+                    )
 
                 # Ensure RGBA mode for ICO
                 if img.mode != 'RGBA':
@@ -0,0 +1,36 @@
+"""Tests for ImageConverter.convert_images (batch conversion in worker processes)."""
+
+from pathlib import Path
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+pytest.importorskip("pillow_heif")
+pytest.importorskip("pillow_avif")
+
+from core.converter import ImageConverter
+from core.format_settings import ConversionSettings, ImageFormat
+
+
+def test_convert_images_runs_two_jobs_through_the_process_pool(tmp_path):
+    jobs = []
+    for index, color in enumerate(("red", "blue")):
+        source = tmp_path / f"input_{index}.png"
+        Image.new("RGB", (64, 48), color).save(source)
+        jobs.append((source, tmp_path / f"output_{index}.jpg"))
+
+    log_folder = Path("logs")
+    logs_before = set(log_folder.glob("*.log"))
+
+    settings = ConversionSettings(output_format=ImageFormat.JPEG, quality=80)
+    results = ImageConverter.convert_images(jobs, settings, max_workers=2)
+
+    assert [success for success, _, _ in results] == [True, True]
+    for (_, output_path), (_, _, size) in zip(jobs, results):
+        assert output_path.stat().st_size == size
+        with Image.open(output_path) as img:
+            assert img.format == "JPEG"
+            assert img.size == (64, 48)
+
+    # Workers drop the log file they open on import
+    assert set(log_folder.glob("*.log")) == logs_before
@@ -25,6 +25,7 @@ from utils.file_utils import load_image_files, SUPPORTED_FORMATS
 from workers.batch_processor import BatchProcessor
 from workers.conversion_worker import ConversionWorker
 from core.format_settings import ConversionSettings
+from core.output_preview_generator import OutputPreviewGenerator
 from workers.output_preview_worker import OutputPreviewWorker
 from utils.logger import logger
 
@@ -55,6 +56,9 @@ class MainWindow(QMainWindow):
         # Connect cache clear signal
         self.app_settings.clear_caches_requested.connect(self._on_clear_all_caches)
 
+        # Keep a running batch in step with the concurrent workers setting
+        self.app_settings.performance_changed.connect(self._on_performance_settings_changed)
+
         # Apply thread pool size setting on startup
         self._apply_threadpool_setting()
 
@@ -788,6 +792,9 @@ class MainWindow(QMainWindow):
         """Override closeEvent to save window state before closing."""
         self._save_window_state()
 
+        # Write any debounced app settings before exit
+        self.app_settings.flush()
+
         # Manually close independent windows
         if self.log_window is not None:
             self.log_window.close()
@@ -1170,10 +1177,18 @@ class MainWindow(QMainWindow):
 
         return (file_path, settings_hash)
 
+    def _on_performance_settings_changed(self):
+        """Apply the concurrent workers setting to an existing batch processor."""
+        if self.batch_processor is not None:
+            self.batch_processor.set_max_concurrent(
+                self.app_settings.get_max_concurrent_workers()
+            )
+
     def _on_clear_all_caches(self):
         """Handle cache clear request from app settings."""
-        # Clear output preview cache
+        # Clear output preview cache (and the generator's prepared images)
         self.output_preview_cache.clear()
+        OutputPreviewGenerator.clear_prepared_cache()
         logger.info("Output preview cache cleared", source="MainWindow")
 
         # Clear preview widget caches (thumbnail + HD)
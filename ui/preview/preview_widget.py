@@ -154,14 +154,19 @@ class PreviewWidget(QWidget):
             preview_mode: If True, downscale to PREVIEW_MAX_DIMENSION for performance
         """
         try:
-            from PIL import Image, ImageOps
+            from PIL import Image
+            from core.converter import ImageConverter
 
             # Load with PIL (this supports AVIF via pillow-avif-plugin)
             with Image.open(image_path) as pil_image:
                 original_size = (pil_image.width, pil_image.height)
 
+                # JPEG: let libjpeg decode at a reduced scale that still covers the preview size
+                if preview_mode and pil_image.format == 'JPEG':
+                    pil_image.draft('RGB', (self.PREVIEW_MAX_DIMENSION, self.PREVIEW_MAX_DIMENSION))
+
                 # Apply EXIF orientation
-                pil_image = ImageOps.exif_transpose(pil_image)
+                pil_image = ImageConverter.apply_exif_orientation(pil_image)
 
                 # === PREVIEW MODE: Downscale if needed ===
                 if preview_mode:
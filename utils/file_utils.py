@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 from typing import List, Optional
 from PIL import Image
@@ -5,6 +6,9 @@ from models.image_file import ImageFile
 
 from utils.logger import logger
 
+# Snapshot of supported extensions written by build.py next to the compiled app
+SUPPORTED_FORMATS_SNAPSHOT = Path(__file__).resolve().parent.parent / "supported_formats.json"
+
 
 def _get_pillow_supported_extensions() -> List[str]:
     """
@@ -36,8 +40,25 @@ def _get_pillow_supported_extensions() -> List[str]:
     return sorted(list(supported))
 
 
+def _load_supported_extensions() -> List[str]:
+    """
+    Get supported extensions, preferring the build-time snapshot in compiled builds.
+
+    Image.registered_extensions() imports every Pillow plugin, which is a
+    noticeable startup cost. Compiled (Nuitka) builds ship the list captured
+    at build time instead; running from source always asks Pillow directly.
+    """
+    if "__compiled__" in globals():
+        try:
+            return json.loads(SUPPORTED_FORMATS_SNAPSHOT.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass  # Missing or unreadable snapshot - fall back to Pillow
+
+    return _get_pillow_supported_extensions()
+
+
 # Dynamically populate supported formats based on what Pillow can actually handle
-SUPPORTED_FORMATS = _get_pillow_supported_extensions()
+SUPPORTED_FORMATS = _load_supported_extensions()
 
 
 def is_supported_image(file_path: Path) -> bool:
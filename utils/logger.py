@@ -212,6 +212,22 @@ class AppLogger:
         with self._lock:
             self.messages.clear()
 
+    def disable_file_output(self):
+        """
+        Stop file logging and delete this process's log file.
+
+        For worker processes: importing this module opens a log file, but
+        workers report their results back to the GUI process instead.
+        """
+        with self._lock:
+            if self.file_handle:
+                try:
+                    self.file_handle.close()
+                    self.log_file.unlink()
+                except OSError:
+                    pass
+                self.file_handle = None
+
     def get_log_file_path(self) -> Optional[Path]:
         """Get the current log file path."""
         return self.log_file if self.log_file.exists() else None
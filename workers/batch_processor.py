@@ -334,6 +334,29 @@ class BatchProcessor(QObject):
         self.is_paused = True
         logger.info("Batch paused. Active conversions will finish.", "BatchProcessor")
 
+    def set_max_concurrent(self, max_concurrent: int):
+        """
+        Change the concurrent worker limit, including for a running batch.
+
+        Raising the limit starts queued files immediately; lowering it lets
+        active workers finish and simply starts fewer new ones.
+
+        Args:
+            max_concurrent: New maximum number of simultaneous conversions
+        """
+        if max_concurrent == self.max_concurrent:
+            return
+
+        logger.info(
+            f"Concurrent workers changed: {self.max_concurrent} → {max_concurrent}",
+            "BatchProcessor"
+        )
+        self.max_concurrent = max_concurrent
+
+        if self.is_batch_running and not self.is_paused and not self.cancel_requested:
+            while len(self.active_workers) < self.max_concurrent and self.file_queue:
+                self._start_next_file()
+
     def resume_batch(self):
         """
         Resume paused batch conversion.
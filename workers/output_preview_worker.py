@@ -142,8 +142,8 @@ class OutputPreviewWorker(QRunnable):
             pil_image.save(buffer, **save_kwargs)
             buffer.seek(0)
 
-            # Get file size from buffer
-            file_size_bytes = len(buffer.getvalue())
+            # Get file size from buffer (zero-copy, getvalue() would copy the bytes)
+            file_size_bytes = buffer.getbuffer().nbytes
             logger.info(
                 f"Estimated output size: {file_size_bytes / 1024:.2f} KB",
                 source="OutputPreviewWorker"
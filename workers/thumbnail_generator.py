@@ -4,9 +4,10 @@ Thumbnail generator worker for async thumbnail creation.
 
 from PySide6.QtCore import QObject, Signal, QRunnable
 from PySide6.QtGui import QPixmap, QImage
-from PIL import Image, ImageOps
+from PIL import Image
 from pathlib import Path
 from typing import Optional
+from core.converter import ImageConverter
 
 
 class ThumbnailSignals(QObject):
@@ -45,7 +46,7 @@ class ThumbnailGenerator(QRunnable):
         try:
             with Image.open(self.image_path) as img:
                 # Apply EXIF orientation
-                img = ImageOps.exif_transpose(img)
+                img = ImageConverter.apply_exif_orientation(img)
 
                 # Calculate dimensions maintaining aspect ratio
                 aspect_ratio = img.width / img.height
@@ -58,7 +59,8 @@ class ThumbnailGenerator(QRunnable):
                 # Resize image
                 img_resized = img.resize(
                     (thumb_width, thumb_height),
-                    Image.Resampling.LANCZOS
+                    Image.Resampling.LANCZOS,
+                    reducing_gap=2.0  # Box-reduce first, as Image.thumbnail() does
                 )
 
                 # Convert to RGB/RGBA for Qt compatibility